@@ -0,0 +1,113 @@
+"""
+Async entry points (Python 3.5+).
+
+``acreate()`` and ``abuild()`` take the same arguments as ``create()`` and
+``build()`` and can be awaited from async views, async tests and seed
+scripts.
+
+Queries go through Django's async ORM methods (``aexists``, ``afirst``,
+``asave``) where the installed Django provides them, and through asgiref's
+``sync_to_async`` otherwise.  Both run them one at a time on a single
+thread (the one holding the connection, e.g. the test transaction), so they
+are awaited in turn rather than gathered.  Without asgiref they run inline
+and block the event loop.
+"""
+from django.db.models import Model
+
+from fixtureless import generator
+from fixtureless import ledger
+from fixtureless.factory import Factory
+
+try:
+    from asgiref.sync import sync_to_async
+except ImportError:
+    sync_to_async = None
+
+
+async def _call(obj, name, *args, **kwargs):
+    """
+    Await ``obj.a<name>(...)`` when Django has it, else ``obj.<name>(...)``.
+    """
+    method = getattr(obj, 'a{}'.format(name), None)
+    if method is not None:
+        return await method(*args, **kwargs)
+    method = getattr(obj, name)
+    if sync_to_async is not None:
+        return await sync_to_async(method)(*args, **kwargs)
+    return method(*args, **kwargs)
+
+
+async def _unique_val(gen, instance, field):
+    func = gen.get_func(field)
+    while True:
+        val = func(instance=instance, field=field)
+        if val is None:
+            if field.null:
+                # NULLs never collide
+                return val
+            continue
+        taken = field.model.objects.filter(**{field.name: val})
+        if not await _call(taken, 'exists'):
+            return val
+
+
+async def _foreignkey_val(instance, field):
+    klass = generator.related_model(field)
+    parent = None
+    if not field.unique:
+        # Try to retrieve the last one
+        parent = await _call(klass.objects.order_by('-pk'), 'first')
+    if parent is None and klass is field.model:
+        # Its parent would need a parent of its own, and so on.
+        return generator.self_reference(instance, field)
+    if parent is None:
+        parent = await acreate_model_instance(klass)
+        await _call(parent, 'save')
+        ledger.record([parent])
+    return parent
+
+
+async def acreate_model_instance(klass, **kwargs):
+    instance = klass(**kwargs)
+    gen = generator.Generator(Model)
+    for field in generator.autogen_fields(instance, kwargs):
+        if field.is_relation:
+            val = await _foreignkey_val(instance, field)
+        elif field.unique:
+            val = await _unique_val(gen, instance, field)
+        else:
+            val = gen.get_val(instance=instance, field=field)
+        generator.set_val(instance, field, val)
+    return instance
+
+
+async def _deliver(args, save):
+    factory = Factory(Model)
+    objs = []
+    for spec in factory._specs(*args):
+        model, kwargs_iter = factory._resolve_args(*spec)
+        for kwargs in kwargs_iter:
+            instance = await acreate_model_instance(model, **(kwargs or {}))
+            if save:
+                await _call(instance, 'save')
+                ledger.record([instance])
+            objs.append(instance)
+    return tuple(objs) if len(objs) > 1 else objs[0]
+
+
+async def acreate(*args):
+    """
+    Async counterpart of fixtureless.factory.create
+    :param args: Arguments are parsed in the factory.
+    :return: A (saved) model instance or list depending on the args
+    """
+    return await _deliver(args, save=True)
+
+
+async def abuild(*args):
+    """
+    Async counterpart of fixtureless.factory.build
+    :param args: Arguments are parsed in the factory.
+    :return: A model instance or list depending on the args
+    """
+    return await _deliver(args, save=False)
@@ -0,0 +1,107 @@
+"""
+Batched inserts of generated instances.
+
+``bulk_create`` refuses models with multi-table inheritance, so those are
+inserted a table at a time instead: the rows of the root parent table go in
+first, in batches, then the rows of each child table with their parent
+pointers set from the primary keys of the rows above.  This needs the
+primary keys up front, which fixtureless generates unless they are given as
+None; such instances are saved one at a time.
+"""
+import itertools
+
+from django.db import connections, router
+
+from fixtureless import ledger
+from fixtureless import signals
+from fixtureless import utils
+
+
+def can_bulk_create(model):
+    """
+    ``bulk_create`` refuses models with multi-table inheritance.
+    """
+    concrete_model = model._meta.concrete_model
+    return all(parent._meta.concrete_model is concrete_model
+               for parent in model._meta.get_parent_list())
+
+
+def resolve_relations(model, instances):
+    """
+    Copy the primary keys of related objects that were assigned before they
+    had one, like ``Model.save`` does and ``bulk_create`` doesn't.
+    """
+    fields = [field for field in model._meta.concrete_fields
+              if field.is_relation]
+    for instance in instances:
+        for field in fields:
+            if getattr(instance, field.attname) is not None:
+                continue
+            obj = instance._state.fields_cache.get(field.get_cache_name())
+            if obj is not None and obj.pk is not None:
+                setattr(instance, field.attname, obj.pk)
+
+
+def tables(model):
+    """
+    The concrete models whose tables hold the rows of ``model``, parents
+    first.
+    """
+    concrete_model = model._meta.concrete_model
+    parents = concrete_model._meta.get_parent_list()
+    models = [parent for parent in reversed(parents)
+              if parent._meta.concrete_model is parent]
+    models.append(concrete_model)
+    return models
+
+
+def insert_inherited(model, instances, using, batch_size=None):
+    """
+    Insert instances of a multi-table inheritance child table by table.
+    :return: The instances that were inserted.
+    """
+    root = tables(model)[0]
+    instances = [instance for instance in instances
+                 if getattr(instance, root._meta.pk.attname) is not None]
+    if not instances:
+        return instances
+    resolve_relations(model, instances)
+    connection = connections[using]
+    for table in tables(model):
+        for parent, link in table._meta.parents.items():
+            if link is not None:
+                for instance in instances:
+                    setattr(instance, link.attname,
+                            getattr(instance, parent._meta.pk.attname))
+        fields = table._meta.local_concrete_fields
+        size = batch_size or max(
+            connection.ops.bulk_batch_size(fields, instances), 1)
+        for batch in utils.chunks(instances, size):
+            table._base_manager._insert(batch, fields=fields, using=using)
+    for instance in instances:
+        instance._state.adding = False
+        instance._state.db = using
+    return instances
+
+
+def insert(instances, using=None, batch_size=None):
+    """
+    Write ``instances`` to the database.  Runs of instances of the same model
+    go in with one ``bulk_create``, or one insert per table and batch for
+    multi-table inheritance.
+    """
+    for model, group in itertools.groupby(instances, type):
+        group = list(group)
+        db = using or router.db_for_write(model)
+        if can_bulk_create(model):
+            resolve_relations(model, group)
+            model._base_manager.db_manager(using).bulk_create(
+                group, batch_size=batch_size)
+            inserted = group
+        else:
+            inserted = insert_inherited(model, group, db, batch_size)
+            for instance in group:
+                if instance._state.adding:
+                    instance.save(using=using)
+        signals.created(inserted, db)
+        ledger.record(group)
@@ -0,0 +1,130 @@
+"""
+Checkpointed, resumable seeds.
+
+A ``Seed`` runs a sequence of creates in batches and records its progress in
+a local file after every committed batch: the step and rows done, the rows
+done per model and the state of the ``random`` module.  If the run dies,
+running the same script again skips what was committed, restores the random
+state and carries on, so the final dataset is the one an uninterrupted run
+would have made:
+
+    from fixtureless.checkpoint import Seed
+
+    seed = Seed('seed.checkpoint', seed=42, batch_size=10000)
+    seed.create(Customer, 1000000)
+    seed.create(Charge, 50000000, initial={'currency': 'usd'})
+
+Each batch is a scheduled ``create()`` in its own transaction.  Before a
+batch commits its outcome is recorded as pending; on resume the pending
+state is kept only if the batch's rows made it to the database.
+
+Only values drawn from ``random`` are reproduced: fields generated from the
+clock or ``uuid4`` differ between runs, and so do strategies that keep state
+of their own (they restart on resume).  The value pool draws on a background
+thread and can't be used with a seed.
+"""
+import json
+import os
+import random
+
+from django.apps import apps
+from django.db import transaction
+
+from fixtureless import constants
+from fixtureless import exceptions
+from fixtureless import pool
+from fixtureless.factory import create
+
+_replace = getattr(os, 'replace', os.rename)
+
+
+def _label(model):
+    return model._meta.label
+
+
+def _to_tuples(val):
+    if isinstance(val, list):
+        return tuple(_to_tuples(item) for item in val)
+    return val
+
+
+class Seed(object):
+    def __init__(self, path, seed=None, batch_size=constants.BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self._step = 0
+        self.state = self._load()
+        if self.state is None:
+            random.seed(seed)
+            self.state = {'step': 0, 'step_rows': 0, 'rows': {},
+                          'random': random.getstate()}
+            self._save(self.state)
+        else:
+            random.setstate(_to_tuples(self.state['random']))
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path) as f:
+            data = json.load(f)
+        pending = data.get('pending')
+        if pending is not None:
+            model = apps.get_model(pending['model'])
+            if model._base_manager.count() == pending['count']:
+                return pending['state']
+        return data['done']
+
+    def _save(self, done, pending=None):
+        tmp = '{}.tmp'.format(self.path)
+        with open(tmp, 'w') as f:
+            json.dump({'done': done, 'pending': pending}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        _replace(tmp, self.path)
+
+    def create(self, model, count, initial=None, **kwargs):
+        """
+        Create ``count`` instances of ``model`` in batches, unless a previous
+        run already did.
+        :param kwargs: Factory options, ``schedule`` is on by default.
+        :return: The number of instances created by this run.
+        """
+        if pool.get_pool() is not None:
+            raise exceptions.InvalidArguments(
+                'Seeds can not be reproduced with the value pool enabled')
+        kwargs.setdefault('schedule', True)
+        step = self._step
+        self._step += 1
+        if step < self.state['step']:
+            return 0
+        done = self.state['step_rows'] if step == self.state['step'] else 0
+        created = 0
+        while done < count:
+            n = min(self.batch_size, count - done)
+            with transaction.atomic():
+                create(model, [initial] * n, **kwargs)
+                done += n
+                created += n
+                state = self._state(step, done, count, model, n)
+                self._save(self.state, {
+                    'model': _label(model),
+                    'count': model._base_manager.count(),
+                    'state': state})
+            self.state = state
+            self._save(state)
+        return created
+
+    def _state(self, step, done, count, model, n):
+        rows = dict(self.state['rows'])
+        rows[_label(model)] = rows.get(_label(model), 0) + n
+        if done >= count:
+            step, done = step + 1, 0
+        return {'step': step, 'step_rows': done, 'rows': rows,
+                'random': random.getstate()}
+
+    @property
+    def rows(self):
+        """
+        The rows done so far per model label, across runs.
+        """
+        return dict(self.state['rows'])
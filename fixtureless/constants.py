@@ -54,4 +54,46 @@ AUTO_FIELD_NAME = 'auto_field'
 # django-fixtureless we need to be able to generate values for these fields.
 SPECIAL_FIELDS = (BOOLEAN_FIELD_NAME, AUTO_FIELD_NAME)
 
+# Value pool (see fixtureless.pool).  Each buffer holds at most
+# POOL_SIZE values and is refilled once it drops to POOL_LOW_WATER.
+POOL_SIZE = 1024
+POOL_LOW_WATER = POOL_SIZE // 2
+# Seconds the refill thread sleeps when nobody has asked for a refill.
+POOL_REFILL_INTERVAL = 0.1
 
+# Rows per INSERT for the bulk paths (pipelined create, scheduler, ...).
+BATCH_SIZE = 500
+# Batches the pipelined create may generate ahead of the inserting thread.
+PIPELINE_DEPTH = 2
+
+# Existing rows considered as many-to-many targets (see fixtureless.m2m).
+M2M_TARGETS = 1000
+
+# Parent rows a fixtureless.distributions sampler chooses from.
+FK_PARENTS = 10000
+
+# Relative traffic per hour of the day for fixtureless.timestamps.Diurnal:
+# quiet nights, a morning ramp and an evening peak.
+DIURNAL_WEIGHTS = (2, 1, 1, 1, 1, 2, 4, 7, 10, 12, 13, 13,
+                   12, 12, 12, 11, 11, 12, 13, 14, 13, 10, 7, 4)
+
+# Pre-built text blocks the fixtureless.payloads strategies are cut from.
+PAYLOAD_BLOCK_SIZE = 1024
+PAYLOAD_BLOCKS = 64
+
+# Page cache for SQLite during fixtureless.fastload (negative: in KiB).
+SQLITE_FAST_LOAD_CACHE_SIZE = -200000
+
+# Generated files for fixtureless.files: the size of a file and the number
+# of distinct files (and images) rows share, and the size of the images.
+FILE_SIZE = 256
+FILE_VARIANTS = 8
+IMAGE_SIZE = (16, 16)
+
+# fixtureless.loadtest: worker threads and reported latency percentiles.
+LOAD_CONCURRENCY = 4
+LOAD_PERCENTILES = (50, 90, 99)
+
+# Upper bounds (seconds) of the insert latency histogram buckets of
+# fixtureless.trickle.
+TRICKLE_BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0)
@@ -0,0 +1,181 @@
+"""
+Scale-factor datasets.
+
+A dataset spec describes the relative sizes of the models in a dataset,
+e.g. 1 customer to 20 charges to 3 refunds, and ``Dataset.create`` makes a
+dataset of any scale from it:
+
+    from fixtureless.datasets import Dataset
+
+    dataset = Dataset({
+        Customer: 1,
+        Charge: {'ratio': 20, 'initial': {'currency': 'usd'}},
+        Refund: {'ratio': 3, 'strategies': {'charge': 'zipf'}}})
+    dataset.create(scale=100)  # 100 customers, 2000 charges, 300 refunds
+
+Specs can also be loaded from JSON, with models named ``app_label.Model``:
+
+    {"shop.Customer": 1, "shop.Charge": 20, "shop.Refund": {"ratio": 3}}
+
+``Dataset.top_up`` (and ``top_up({Model: count})``) only creates the rows
+missing from the database, e.g. to refill a partially wiped staging
+database; running it twice creates nothing the second time.
+
+Models are created in dependency order, one scheduled ``create()`` per
+model.  Non-unique foreign keys to other models of the dataset pick their
+parents uniformly among the instances created for it (see
+fixtureless.distributions) unless a strategy is given; a strategy may be a
+callable or one of the names in ``DISTRIBUTIONS``.
+"""
+import collections
+import inspect
+import json
+
+from django.apps import apps
+
+from fixtureless import constants
+from fixtureless import distributions
+from fixtureless import exceptions
+from fixtureless import generator
+from fixtureless import scheduler
+from fixtureless.factory import create
+
+DISTRIBUTIONS = {
+    'uniform': distributions.Uniform,
+    'sequential': distributions.Sequential,
+    'zipf': distributions.Zipf,
+}
+
+
+def _unique_parents(model, initial=None):
+    """
+    The models each new ``model`` instance creates a parent of, once per
+    unique foreign key left to generate.
+    """
+    initial = initial or {}
+    return [generator.related_model(field) for field in model._meta.fields
+            if field.is_relation and field.unique
+            and not field.remote_field.parent_link
+            and field.name not in initial and field.attname not in initial
+            and generator.related_model(field) is not model]
+
+
+def _model(key):
+    if not inspect.isclass(key):
+        try:
+            return apps.get_model(key)
+        except (LookupError, ValueError):
+            raise exceptions.InvalidArguments(
+                'Unknown model {}'.format(key))
+    return key
+
+
+def _strategy(val, pks=None, limit=constants.FK_PARENTS):
+    if callable(val):
+        return val
+    try:
+        return DISTRIBUTIONS[val](limit=limit, pks=pks)
+    except KeyError:
+        raise exceptions.InvalidArguments(
+            'Unknown distribution {}'.format(val))
+
+
+class Dataset(object):
+    def __init__(self, spec):
+        self.entries = collections.OrderedDict()
+        for key, entry in spec.items():
+            if not isinstance(entry, dict):
+                entry = {'ratio': entry}
+            self.entries[_model(key)] = entry
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls(json.load(f, object_pairs_hook=collections.OrderedDict))
+
+    def counts(self, scale=1):
+        """
+        The number of instances of each model at ``scale``.
+        """
+        return collections.OrderedDict(
+            (model, int(round(entry['ratio'] * scale)))
+            for model, entry in self.entries.items())
+
+    def strategies(self, model, created=None, limit=constants.FK_PARENTS):
+        """
+        The strategies of ``model``, keyed by field name.
+        :param created: The instances created so far, by model.  Foreign keys
+            to these models choose among them.
+        :param limit: Else they choose among the first ``limit`` rows (all of
+            them if None).
+        """
+        created = created or {}
+        names = self.entries[model].get('strategies') or {}
+        strategies = {}
+        for field in model._meta.fields:
+            if not field.is_relation or field.unique:
+                continue
+            target = generator.related_model(field)
+            if target in self.entries and target is not model:
+                pks = [obj.pk for obj in created.get(target, ())] or None
+                strategies[field.name] = _strategy(
+                    names.get(field.name, 'uniform'), pks, limit)
+        for name, val in names.items():
+            if name not in strategies:
+                strategies[name] = _strategy(val, limit=limit)
+        return strategies
+
+    def create(self, scale=1, **kwargs):
+        """
+        Create the dataset at ``scale``.
+        :param kwargs: Factory options, ``schedule`` is on by default.
+        :return: The created instances, by model.
+        """
+        return self._create(self.counts(scale), kwargs)
+
+    def top_up(self, scale=1, **kwargs):
+        """
+        Create only the instances missing for the dataset at ``scale``, so
+        running it again is a no-op.  Foreign keys to the dataset's models
+        choose among all their rows, old and new.  The parents that unique
+        foreign keys create count towards their model's target.
+        :param kwargs: Factory options, ``schedule`` is on by default.
+        :return: The created instances, by model.
+        """
+        counts = self.counts(scale)
+        implied = collections.Counter()
+        # Children first, so the parents they will create are known
+        for model in reversed(scheduler.order(counts)):
+            missing = counts[model] - model._base_manager.count()
+            counts[model] = max(0, missing - implied[model])
+            initial = self.entries[model].get('initial')
+            for parent in _unique_parents(model, initial):
+                if parent in counts:
+                    implied[parent] += counts[model] + implied[model]
+        return self._create(counts, kwargs, reuse=True)
+
+    def _create(self, counts, kwargs, reuse=False):
+        extra = kwargs.pop('strategies', None) or {}
+        kwargs.setdefault('schedule', True)
+        created = collections.OrderedDict()
+        for model in scheduler.order(counts):
+            if not counts[model]:
+                continue
+            if reuse:
+                strategies = self.strategies(model, limit=None)
+            else:
+                strategies = self.strategies(model, created)
+            strategies.update(extra)
+            initial = self.entries[model].get('initial')
+            objs = create(model, [initial] * counts[model],
+                          strategies=strategies, **kwargs)
+            created[model] = list(objs) if isinstance(objs, tuple) else [objs]
+        return created
+
+
+def top_up(targets, **kwargs):
+    """
+    Create the instances missing to reach ``targets``, a dict of counts by
+    model (or ``app_label.Model`` name).
+    """
+    return Dataset(targets).top_up(**kwargs)
@@ -0,0 +1,143 @@
+"""
+Parent selection for foreign keys.
+
+By default every non-unique foreign key points at the latest row of the
+related model, which puts all children on a single parent.  The samplers
+below pick a parent from a cached list of primary keys instead, so seeded
+databases can reproduce the hot rows and skew seen in production:
+
+    from fixtureless import distributions
+
+    create(Charge, 10000, strategies={
+        'customer': distributions.Zipf(1.2),
+        'merchant': distributions.Uniform()})
+
+The primary keys are read once per sampler and related model, ordered by
+pk, so the lowest keys are the hottest under ``Zipf``.  Pass ``pks`` to
+choose from given parents instead.
+"""
+import bisect
+import random
+
+from fixtureless import constants
+from fixtureless import exceptions
+from fixtureless import generator
+
+
+class Distribution(object):
+    """
+    Base class for the parent samplers.  Subclasses implement ``choose``,
+    which picks a primary key out of what ``prepare`` made of the pks.
+    ``pks`` restricts the parents to the given primary keys instead of the
+    first ``limit`` rows.
+    """
+    def __init__(self, limit=constants.FK_PARENTS, pks=None):
+        self.limit = limit
+        self.given_pks = pks
+        self._parents = {}
+
+    def __call__(self, **kwargs):
+        field = kwargs['field']
+        if field.unique:
+            raise exceptions.InvalidArguments(
+                '{} is unique and can not share parents'.format(field.name))
+        model = generator.related_model(field)
+        try:
+            parents = self._parents[model]
+        except KeyError:
+            parents = self._parents[model] = self.prepare(self.load(model))
+        return self.choose(parents)
+
+    def load(self, model):
+        if self.given_pks is not None:
+            pks = list(self.given_pks)
+        else:
+            pks = list(model._base_manager.order_by('pk').values_list(
+                'pk', flat=True)[:self.limit])
+        if not pks:
+            raise exceptions.InvalidArguments(
+                'There are no {} rows to choose from'.format(model.__name__))
+        return pks
+
+    def prepare(self, pks):
+        return pks
+
+    def choose(self, parents):
+        raise NotImplementedError
+
+
+class Uniform(Distribution):
+    def choose(self, parents):
+        return random.choice(parents)
+
+
+class Sequential(Distribution):
+    """
+    Hands the parents out in turn, e.g. for even partitions.
+    """
+    def __init__(self, limit=constants.FK_PARENTS, pks=None):
+        super(Sequential, self).__init__(limit, pks)
+        self._next = 0
+
+    def choose(self, parents):
+        pk = parents[self._next % len(parents)]
+        self._next += 1
+        return pk
+
+
+class Weighted(Distribution):
+    """
+    Picks parents with the given relative weights: either a dict of
+    ``{pk: weight}`` or a sequence of weights applied to the parents in pk
+    order (parents past the end of the sequence are never picked).
+    """
+    def __init__(self, weights, limit=constants.FK_PARENTS, pks=None):
+        super(Weighted, self).__init__(limit, pks)
+        if weights is not None:
+            vals = weights.values() if isinstance(weights, dict) else weights
+            if any(weight < 0 for weight in vals) or sum(vals) <= 0:
+                raise exceptions.InvalidArguments(
+                    'The weights must be positive or 0, and not all 0')
+        self.weights = weights
+
+    def load(self, model):
+        if isinstance(self.weights, dict):
+            return list(self.weights)
+        return super(Weighted, self).load(model)[:len(self.weights)]
+
+    def weights_for(self, pks):
+        if isinstance(self.weights, dict):
+            return [self.weights[pk] for pk in pks]
+        return self.weights[:len(pks)]
+
+    def prepare(self, pks):
+        cumulative = []
+        total = 0
+        for weight in self.weights_for(pks):
+            total += weight
+            cumulative.append(total)
+        if total <= 0:
+            raise exceptions.InvalidArguments(
+                'The parents that exist all have a weight of 0')
+        return pks, cumulative
+
+    def choose(self, parents):
+        pks, cumulative = parents
+        point = random.random() * cumulative[-1]
+        return pks[bisect.bisect_right(cumulative, point)]
+
+
+class Zipf(Weighted):
+    """
+    The parent of rank ``k`` (in pk order, from 1) is picked with a weight
+    of ``1 / k ** s``.
+    """
+    def __init__(self, s=1.0, limit=constants.FK_PARENTS, pks=None):
+        super(Zipf, self).__init__(None, limit, pks)
+        self.s = s
+
+    def load(self, model):
+        return Distribution.load(self, model)
+
+    def weights_for(self, pks):
+        return [1.0 / rank ** self.s for rank in range(1, len(pks) + 1)]
@@ -4,14 +4,36 @@ import itertools
 from django.db.models import Model
 from django.forms import Form
 
+from fixtureless import constants
 from fixtureless import exceptions
 from fixtureless import generator
+from fixtureless import graph
+from fixtureless import lazy
+from fixtureless import ledger
+from fixtureless import m2m
+from fixtureless import prototype
+from fixtureless import signals
+from fixtureless.pipeline import Pipeline
+from fixtureless.scheduler import Scheduler
 from fixtureless.utils import list_get
 
 
 class Factory(object):
-    def __init__(self, obj_type):
+    def __init__(self, obj_type, lazy=False, pipeline=False, schedule=False,
+                 m2m=None, children=None, strategies=None, signals=True,
+                 prototype=False, vary=(), batch_size=constants.BATCH_SIZE):
         self.obj_type = obj_type
+        # Shared by every instance of a call, see Generator.get_vals
+        self.generator = generator.Generator(obj_type, strategies)
+        self.lazy = lazy
+        self.pipeline = pipeline
+        self.schedule = schedule
+        self.m2m = m2m
+        self.children = children
+        self.signals = signals
+        self.prototype = prototype
+        self.vary = vary
+        self.batch_size = batch_size
 
     @staticmethod
     def _verify_kwargs(vals):
@@ -54,27 +76,95 @@ class Factory(object):
         self._verify_kwargs(kwargs_iter)
         return model, kwargs_iter
 
-    def _create_instance(self, *args, **kwargs):
+    def _create_instance(self, klass, **kwargs):
         name = self.obj_type.__name__.lower()
-        func = getattr(generator, 'create_{}_instance'.format(name))
+        module = lazy if self.lazy else generator
+        func = getattr(module, 'generate_{}_instance'.format(name), None)
         if func:
-            return func(*args, **kwargs)
-        raise NotImplemented('There are no generator create methods for {} type'.format(name))
+            return func(klass, kwargs, self.generator)
+        raise NotImplementedError(
+            'There are no {} create methods for {} type'.format(
+                module.__name__, name))
 
     def _handle_build(self, *args):
         instance, kwargs_iter = self._resolve_args(*args)
+        if self.prototype:
+            return prototype.generate_copies(
+                instance, kwargs_iter, self.generator, self.vary,
+                self.batch_size)
         return (self._create_instance(instance, **(kwargs if kwargs else {}))
                 for kwargs in kwargs_iter)
 
-    def _order_and_build(self, *args):
+    def _specs(self, *args):
+        """
+        Normalize the single-model form ``(Model[, count | initial])`` to the
+        multi-model form ``((Model, ...), (Model, ...))``.
+        """
         if inspect.isclass(args[0]) and issubclass(args[0], self.obj_type):
             args = (args,)
-        builds = itertools.starmap(self._handle_build, args)
+        return args
+
+    def _order_and_build(self, *args):
+        builds = itertools.starmap(self._handle_build, self._specs(*args))
         return itertools.chain.from_iterable(builds)
 
+    def _saver(self):
+        if not self.pipeline:
+            return self.save_instances
+        self._require_create('pipeline', True)
+        return Pipeline(self.batch_size).save_instances
+
+    def _require_create(self, option, save):
+        if not (save and issubclass(self.obj_type, Model)):
+            raise exceptions.InvalidArguments(
+                'The {} option only applies when creating model'
+                ' instances.'.format(option))
+
+    def _models(self, *args):
+        return [self._resolve_args(*spec)[0] for spec in self._specs(*args)]
+
     def _deliver(self, *args, **kwargs):
-        pipeline = self._order_and_build(*args)
-        objs = tuple(self.save_instances(pipeline) if kwargs['save'] else pipeline)
+        if self.signals is True:
+            return self._deliver_objs(*args, **kwargs)
+        with signals.muted(self.signals == 'batched', self.batch_size):
+            return self._deliver_objs(*args, **kwargs)
+
+    def _check_prototype(self):
+        if self.vary and not self.prototype:
+            raise exceptions.InvalidArguments(
+                'The vary option only applies to prototype copies.')
+        if not issubclass(self.obj_type, Model) or self.lazy \
+                or self.schedule:
+            raise exceptions.InvalidArguments(
+                'The prototype option only applies to model instances that'
+                ' are neither lazy nor scheduled.')
+
+    def _deliver_objs(self, *args, **kwargs):
+        if self.prototype or self.vary:
+            self._check_prototype()
+        if self.m2m:
+            self._require_create('m2m', kwargs['save'])
+            m2m.check(self._models(*args), self.m2m)
+        if self.children:
+            self._require_create('children', kwargs['save'])
+            graph.check(self._models(*args), self.children)
+        if self.schedule:
+            self._require_create('schedule', kwargs['save'])
+            if self.pipeline:
+                raise exceptions.InvalidArguments(
+                    'Scheduled creates insert each model in bulk and cannot'
+                    ' be pipelined.')
+            objs = tuple(Scheduler(
+                self.batch_size, self.generator).create(self, *args))
+        else:
+            pipeline = self._order_and_build(*args)
+            objs = tuple(
+                self._saver()(pipeline) if kwargs['save'] else pipeline)
+        if self.m2m:
+            m2m.populate(objs, self.m2m, self.batch_size)
+        if self.children:
+            graph.populate(
+                objs, self.children, self.batch_size, self.generator)
         return objs if len(objs) > 1 else objs[0]
 
     def create(self, *args):
@@ -86,41 +176,66 @@ class Factory(object):
     @staticmethod
     def save_instances(iterable):
         for instance in iterable:
-            instance.save()
+            # Forms have nothing to save
+            if isinstance(instance, Model):
+                instance.save()
+                ledger.record([instance])
             yield instance
 
 
-def create(*args):
+def create(*args, **kwargs):
     """
     This is the preferred interface for using fixtureless
     :param args: Arguments are parsed in the factory.
+    :param kwargs: Factory options.  ``pipeline=True`` generates the next
+        ``batch_size`` instances while the previous batch is inserted on a
+        separate connection (see fixtureless.pipeline).  ``schedule=True``
+        creates referenced models first and inserts each model in bulk (see
+        fixtureless.scheduler).  ``m2m={'field': fan_out}`` links each
+        instance to ``fan_out`` targets of many-to-many fields (see
+        fixtureless.m2m).  ``children={'accessor': fan_out}`` creates
+        ``fan_out`` related objects per instance, level by level (see
+        fixtureless.graph).  ``strategies={'field': callable}`` replaces
+        the generated values of fields (see fixtureless.distributions).
+        ``prototype=True`` makes copies of one generated instance and only
+        generates unique fields and the fields listed in ``vary`` again
+        (see fixtureless.prototype).  ``signals=False`` mutes model
+        signals, ``signals='batched'`` sends one ``post_create`` per model
+        and batch instead (see fixtureless.signals).
     :return: A (saved) model instance or list depending on the args
     """
-    return Factory(Model).create(*args)
+    return Factory(Model, **kwargs).create(*args)
 
 
-def build(*args):
+def build(*args, **kwargs):
     """
     This is the preferred interface for using fixtureless
     :param args: Arguments are parsed in the factory.
+    :param kwargs: Factory options.  ``lazy=True`` defers generating each
+        field until it is first read (see fixtureless.lazy).
+        ``prototype=True`` copies one generated instance (see
+        fixtureless.prototype).
     :return: A model instance or list depending on the args
     """
-    return Factory(Model).build(*args)
+    return Factory(Model, **kwargs).build(*args)
 
 
-def create_form(*args):
+def create_form(*args, **kwargs):
     """
     This is the preferred interface for using fixtureless
     :param args: Arguments are parsed in the factory.
-    :return: A form instance or list depending on the args
+    :param kwargs: Factory options.
+    :return: A bound form instance or list depending on the args; see
+        fixtureless.formdata for streams of POST data.
     """
-    return Factory(Form).create(*args)
+    return Factory(Form, **kwargs).create(*args)
 
 
-def build_form(*args):
+def build_form(*args, **kwargs):
     """
     This is the preferred interface for using fixtureless
     :param args: Arguments are parsed in the factory.
+    :param kwargs: Factory options.
     :return: A form instance or list depending on the args
     """
-    return Factory(Form).build(*args)
+    return Factory(Form, **kwargs).build(*args)
@@ -0,0 +1,160 @@
+"""
+Fast loading.
+
+``fast_load()`` relaxes durability and defers index and constraint
+maintenance for the duration of a big seed, and puts everything back when it
+ends, whether the seed succeeded or not:
+
+    from fixtureless.fastload import fast_load
+
+    with fast_load([Customer, Charge]):
+        create((Customer, 10000), (Charge, 1000000), schedule=True)
+
+On PostgreSQL ``synchronous_commit`` is turned off, and the secondary
+indexes and foreign key constraints of the given models' tables are dropped
+and rebuilt at the end (primary keys and unique constraints stay).  On
+SQLite the ``cache_size`` pragma is raised and, outside of transactions,
+``synchronous`` and ``journal_mode`` are relaxed.  Other databases are left
+alone.  Pipelined creates apply the same session settings to their own
+connection.
+"""
+import contextlib
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from fixtureless import constants
+
+# Session statements for the connections of active fast loads, by alias.
+_session = {}
+
+FOREIGN_KEYS_SQL = (
+    "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint"
+    " WHERE contype = 'f' AND conrelid = %s::regclass")
+INDEXES_SQL = (
+    'SELECT i.relname, pg_get_indexdef(i.oid) FROM pg_index x'
+    ' JOIN pg_class i ON i.oid = x.indexrelid'
+    ' WHERE x.indrelid = %s::regclass'
+    ' AND NOT EXISTS (SELECT 1 FROM pg_constraint c'
+    ' WHERE c.conindid = x.indexrelid)')
+
+
+def prepare(connection):
+    """
+    Apply the session settings of an active fast load to ``connection``.
+    """
+    statements = _session.get(connection.alias, ())
+    if statements:
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
+
+
+class _Postgres(object):
+    def __init__(self, connection, models, indexes, constraints):
+        self.connection = connection
+        self.models = models or ()
+        self.indexes = indexes
+        self.constraints = constraints
+        self.session = ['SET synchronous_commit TO OFF']
+        self.settings_sql = []
+        self.indexes_sql = []
+        self.constraints_sql = []
+
+    def setup(self):
+        quote = self.connection.ops.quote_name
+        with self.connection.cursor() as cursor:
+            cursor.execute('SHOW synchronous_commit')
+            self.settings_sql.append(
+                "SET synchronous_commit TO '{}'".format(cursor.fetchone()[0]))
+            cursor.execute(self.session[0])
+            for model in self.models:
+                table = quote(model._meta.db_table)
+                if self.constraints:
+                    cursor.execute(FOREIGN_KEYS_SQL, [table])
+                    for name, definition in cursor.fetchall():
+                        cursor.execute(
+                            'ALTER TABLE {} DROP CONSTRAINT {}'.format(
+                                table, quote(name)))
+                        self.constraints_sql.append(
+                            'ALTER TABLE {} ADD CONSTRAINT {} {}'.format(
+                                table, quote(name), definition))
+                if self.indexes:
+                    cursor.execute(INDEXES_SQL, [table])
+                    for name, definition in cursor.fetchall():
+                        cursor.execute('DROP INDEX {}'.format(quote(name)))
+                        self.indexes_sql.append(definition)
+
+    def restore(self):
+        # Indexes first, so the constraint checks can use them.
+        _execute_all(self.connection, self.settings_sql + self.indexes_sql
+                     + self.constraints_sql)
+
+
+class _SQLite(object):
+    def __init__(self, connection):
+        self.connection = connection
+        pragmas = [('cache_size', constants.SQLITE_FAST_LOAD_CACHE_SIZE)]
+        if not connection.in_atomic_block:
+            # These can't change inside a transaction.
+            pragmas.extend([('synchronous', 'OFF'),
+                            ('journal_mode', 'MEMORY')])
+        self.pragmas = pragmas
+        self.session = ['PRAGMA {} = {}'.format(*pragma) for pragma in pragmas]
+        self.restore_sql = []
+
+    def setup(self):
+        with self.connection.cursor() as cursor:
+            for (name, _), sql in zip(self.pragmas, self.session):
+                cursor.execute('PRAGMA {}'.format(name))
+                self.restore_sql.append('PRAGMA {} = {}'.format(
+                    name, cursor.fetchone()[0]))
+                cursor.execute(sql)
+
+    def restore(self):
+        _execute_all(self.connection, self.restore_sql)
+
+
+def _execute_all(connection, statements):
+    """
+    Run every statement even if some fail, then raise the first error.
+    """
+    error = None
+    with connection.cursor() as cursor:
+        for sql in statements:
+            try:
+                cursor.execute(sql)
+            except Exception as exc:
+                error = error or exc
+    if error is not None:
+        raise error
+
+
+@contextlib.contextmanager
+def fast_load(models=None, using=DEFAULT_DB_ALIAS, indexes=True,
+              constraints=True):
+    """
+    :param models: The models whose secondary indexes and foreign key
+        constraints are dropped during the load (PostgreSQL only).
+    :param indexes: Set to False to keep the indexes.
+    :param constraints: Set to False to keep the foreign key constraints.
+    """
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        backend = _Postgres(connection, models, indexes, constraints)
+    elif connection.vendor == 'sqlite':
+        backend = _SQLite(connection)
+    else:
+        yield
+        return
+    try:
+        backend.setup()
+        _session[using] = backend.session
+        if connection.in_atomic_block:
+            # Keep the transaction usable for the restore if the load fails.
+            with transaction.atomic(using=using):
+                yield
+        else:
+            yield
+    finally:
+        _session.pop(using, None)
+        backend.restore()
@@ -0,0 +1,109 @@
+"""
+Streams of form payloads.
+
+``payloads(SignupForm, 10000)`` yields 10000 dicts of POST data that
+``SignupForm`` accepts, e.g. to drive load tests against the views handling
+it, without creating any form objects:
+
+    from fixtureless.formdata import payloads
+
+    for data in payloads(SignupForm, 10000, {'plan': 'pro'}):
+        client.post('/signup/', data)
+
+The fields of a form class, and the functions generating their values, are
+looked up once and cached as a ``FormPlan``.  Values are rendered the way a
+browser would send them: unchecked checkboxes are left out, dates and times
+are formatted for the default input formats.  ``encode=True`` yields
+urlencoded bodies instead of dicts.  File fields are left out.
+"""
+import datetime
+import itertools
+
+from django import forms
+from django.utils import timezone
+
+from fixtureless import generator
+
+try:
+    from urllib.parse import urlencode
+except ImportError:
+    # Python 2
+    from urllib import urlencode
+
+
+def to_data(val, field=None):
+    """
+    Render a generated value of ``field`` as POST data, or None to leave it
+    out.
+    """
+    if val is None or val is False:
+        return None
+    if val is True:
+        return 'on'
+    if isinstance(val, (list, tuple)):
+        return [to_data(item) for item in val]
+    if isinstance(field, forms.DateField) and \
+            isinstance(val, datetime.datetime):
+        val = val.date()
+    if isinstance(val, datetime.datetime) and timezone.is_aware(val):
+        val = timezone.make_naive(val)
+    return u'{}'.format(val)
+
+
+class FormPlan(object):
+    """
+    The fields of ``form_class`` with the functions generating their values.
+    """
+    def __init__(self, form_class, strategies=None, prefix=None):
+        strategies = strategies or {}
+        gen = generator.Generator(strategies=strategies)
+        if prefix is None:
+            prefix = form_class.prefix
+        self.form_class = form_class
+        self.fields = [
+            (name, '{}-{}'.format(prefix, name) if prefix else name,
+             field, strategies.get(name) or gen.get_func(field))
+            for name, field in form_class.base_fields.items()
+            if not isinstance(field, forms.FileField)]
+
+    def payload(self, initial=None):
+        initial = initial or {}
+        data = {}
+        for name, key, field, func in self.fields:
+            if name in initial:
+                val = initial[name]
+            else:
+                val = func(instance=None, field=field)
+            val = to_data(val, field)
+            if val is not None:
+                data[key] = val
+        return data
+
+
+_plans = {}
+
+
+def get_plan(form_class):
+    try:
+        return _plans[form_class]
+    except KeyError:
+        return _plans.setdefault(form_class, FormPlan(form_class))
+
+
+def payloads(form_class, count=None, initial=None, strategies=None,
+             encode=False):
+    """
+    Yield POST data for ``form_class``.
+    :param count: The number of payloads, or None for an endless stream.
+    :param initial: Values used instead of generated ones.
+    :param strategies: Callables generating the values of fields, keyed by
+        field name or class (see Generator.get_strategy); the plan is then
+        not cached.
+    :param encode: Yield urlencoded bodies instead of dicts.
+    """
+    plan = FormPlan(form_class, strategies) if strategies \
+        else get_plan(form_class)
+    counter = itertools.count() if count is None else range(count)
+    for _ in counter:
+        data = plan.payload(initial)
+        yield urlencode(data, doseq=True) if encode else data
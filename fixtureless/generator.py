@@ -1,3 +1,4 @@
+import collections
 import sys
 import decimal
 import math
@@ -14,37 +15,112 @@ from django.utils import timezone
 from django.core.exceptions import SuspiciousFileOperation
 
 from fixtureless import constants
+from fixtureless import files
+from fixtureless import ledger
+from fixtureless import pool
 from fixtureless import utils
 
 PY3 = sys.version_info.major == 3
 
 
 class Generator(object):
-    def __init__(self, instance_type=None):
+    def __init__(self, instance_type=None, strategies=None):
         self.is_model = instance_type == models.Model
+        # Callables overriding the _generate_* method of a field, keyed by
+        # field name, field instance or field class.
+        self.strategies = strategies or {}
+        # Unique values handed out by this generator.  Instances that are
+        # inserted together in bulk can't see each other in the database.
+        self._issued = collections.defaultdict(set)
 
     USE_TZ = getattr(settings, 'USE_TZ', False)
 
     def get_val(self, **kwargs):
         field = kwargs['field']
+        func = self.get_func(field)
+        val = func(**kwargs)
+        if val is None and getattr(field, 'null', False):
+            # NULLs never collide
+            return val
+        if hasattr(field, 'unique') and field.unique:
+            issued = self._issued[field]
+            while val in issued or not self._val_is_unique(val, field):
+                val = func(**kwargs)
+            issued.add(val)
+        return val
+
+    def get_vals(self, field, instances):
+        """
+        Generate a value of ``field`` for each of ``instances``.  Unique
+        values are checked against the database with one query per batch
+        instead of one per value.
+        """
+        func = self.get_func(field)
+        vals = [func(instance=instance, field=field) for instance in instances]
+        if not getattr(field, 'unique', False):
+            return vals
+        issued = self._issued[field]
+        pending = range(len(vals))
+        while pending:
+            retry = []
+            fresh = {}
+            for i in pending:
+                if vals[i] is None:
+                    # NULLs never collide
+                    if not field.null:
+                        retry.append(i)
+                elif vals[i] in issued or vals[i] in fresh:
+                    retry.append(i)
+                else:
+                    fresh[vals[i]] = i
+            manager = field.model._base_manager
+            for chunk in utils.chunks(list(fresh), constants.BATCH_SIZE):
+                lookup = {'{}__in'.format(field.name): chunk}
+                for val in manager.filter(**lookup).values_list(
+                        field.name, flat=True):
+                    if val in fresh:
+                        retry.append(fresh.pop(val))
+            issued.update(fresh)
+            for i in retry:
+                vals[i] = func(instance=instances[i], field=field)
+            pending = retry
+        return vals
+
+    def get_strategy(self, field):
+        """
+        Return the strategy registered for ``field``, if any.
+        """
+        if not self.strategies:
+            return None
+        keys = [field, getattr(field, 'name', None)]
+        keys.extend(type(field).__mro__)
+        for key in keys:
+            try:
+                return self.strategies[key]
+            except (KeyError, TypeError):
+                continue
+        return None
+
+    def get_func(self, field):
+        """
+        Return the callable generating (not necessarily unique) values for
+        ``field``.
+        """
+        strategy = self.get_strategy(field)
+        if strategy is not None:
+            return strategy
         if isinstance(field, str):
             callable_name = '_generate_{}'.format(field)
         else:
             callable_name = '_generate_{}'.format(type(field).__name__.lower())
         try:
-            func = getattr(self, callable_name)
+            return getattr(self, callable_name)
         except AttributeError:
             if field.default != NOT_PROVIDED:
-                func = self._generate_field_with_default
-            else:
-                msg = 'fixtureless does not support the field type {} ' \
-                      'without a default'.format(type(field).__name__)
-                raise AttributeError(msg)
-        val = func(**kwargs)
-        if hasattr(field, 'unique') and field.unique:
-            while not self._val_is_unique(val, field):
-                val = func(**kwargs)
-        return val
+                return self._generate_field_with_default
+            msg = 'fixtureless does not support the field type {} ' \
+                  'without a default'.format(type(field).__name__)
+            raise AttributeError(msg)
 
     @staticmethod
     def _val_is_unique(val, field):
@@ -72,12 +148,7 @@ class Generator(object):
     @staticmethod
     def _generate_foreignkey(**kwargs):
         field = kwargs['field']
-        try:
-            # Django >= 1.10
-            klass = field.remote_field.model
-        except AttributeError:
-            # Django 1.8 - 1.9
-            klass = field.related.model
+        klass = related_model(field)
 
         instance = None
         if not field.unique:
@@ -86,9 +157,13 @@ class Generator(object):
                 instance = klass.objects.order_by('-pk')[0]
             except IndexError:
                 instance = None
+        if instance is None and klass is field.model:
+            # Its parent would need a parent of its own, and so on.
+            return self_reference(kwargs['instance'], field)
         if field.unique or instance is None:
             instance = create_model_instance(klass)
             instance.save()
+            ledger.record([instance])
         return instance
 
     def _generate_onetoonefield(self, **kwargs):
@@ -113,20 +188,25 @@ class Generator(object):
         field = kwargs['field']
         if self.is_model and field.default != NOT_PROVIDED:
             return self._generate_field_with_default(**kwargs)
-        len_int_part = field.max_digits - field.decimal_places
+        return pool.draw(
+            self._random_decimal, field.max_digits, field.decimal_places)
+
+    @staticmethod
+    def _random_decimal(max_digits, decimal_places):
+        len_int_part = max_digits - decimal_places
         # Add a scaling factor here to help prevent overflowing the
         # Decimal fields when doing summming, etc. This still won't
         # protect tiny dec fields (1 or 2 digits before the decimal),
         # but should cover most use cases.
         len_int_part = int(math.floor(math.sqrt(len_int_part)))
         if len_int_part == 0:
-            len_fractional_part = random.randint(0, field.decimal_places)
+            len_fractional_part = random.randint(0, decimal_places)
             fractional_part = str(random.random())[2:len_fractional_part+2]
             return decimal.Decimal('0.{}'.format(fractional_part))
 
         max_intval = pow(10, len_int_part) - 2
         int_part = random.randint(-max_intval, max_intval)
-        len_fractional_part = random.randint(0, field.decimal_places)
+        len_fractional_part = random.randint(0, decimal_places)
         if len_fractional_part > 0:
             # Turn into a string, and trim off the '0.' from the start.
             fractional_part = str(random.random())[2:len_fractional_part+2]
@@ -168,10 +248,13 @@ class Generator(object):
         if self.is_model and len(field.choices) > 0:
             return random.choice(field.choices)[0]
 
-        str_len = constants.DEFAULT_CHARFIELD_MAX_LEN
-        if field.max_length is not None:
-            str_len = random.randint(1, field.max_length)
+        return pool.draw(self._random_chars, field.max_length, char_set)
 
+    @staticmethod
+    def _random_chars(max_length, char_set):
+        str_len = constants.DEFAULT_CHARFIELD_MAX_LEN
+        if max_length is not None:
+            str_len = random.randint(1, max_length)
         return utils.random_str(str_len, char_set)
 
     def _generate_charfield(self, **kwargs):
@@ -188,9 +271,13 @@ class Generator(object):
             constants.CHARFIELD_CHARSET_UNICODE, field)
 
     def _generate_imagefield(self, **kwargs):
+        if self.is_model and files.get_storage() is not None:
+            return files.generate_image(kwargs['instance'], kwargs['field'])
         return self._generate_charfield(**kwargs)
 
     def _generate_filefield(self, **kwargs):
+        if self.is_model and files.get_storage() is not None:
+            return files.generate_file(kwargs['instance'], kwargs['field'])
         return self._generate_charfield(**kwargs)
 
     def _generate_textfield(self, **kwargs):
@@ -206,10 +293,13 @@ class Generator(object):
         field = kwargs['field']
         if self.is_model and field.default != NOT_PROVIDED:
             return self._generate_field_with_default(**kwargs)
-        str_len = constants.DEFAULT_CHARFIELD_MAX_LEN
-        if field.max_length is not None:
-            str_len = random.randint(0, field.max_length)
+        return pool.draw(self._random_slug, field.max_length)
 
+    @staticmethod
+    def _random_slug(max_length):
+        str_len = constants.DEFAULT_CHARFIELD_MAX_LEN
+        if max_length is not None:
+            str_len = random.randint(0, max_length)
         return utils.random_str(str_len, constants.SLUGFIELD_CHARSET)
 
     def _generate_datetimefield(self, **kwargs):
@@ -324,6 +414,10 @@ class Generator(object):
         field = kwargs['field']
         if field.default != NOT_PROVIDED:
             return self._generate_field_with_default(**kwargs)
+        return pool.draw(self._random_json)
+
+    @staticmethod
+    def _random_json():
         return json.dumps(utils.get_random_dict())
 
     def _generate_uuidfield(self, **kwargs):
@@ -348,6 +442,25 @@ class Generator(object):
         return settings.DATABASES[db_name]['ENGINE'].split('.')[-1]
 
 
+def related_model(field):
+    try:
+        # Django >= 1.10
+        return field.remote_field.model
+    except AttributeError:
+        # Django 1.8 - 1.9
+        return field.related.model
+
+
+def self_reference(instance, field):
+    """
+    The value of a foreign key to its own model that no other row can fill:
+    nothing if the field is nullable, else ``instance`` itself.
+    """
+    if field.null:
+        return None
+    return instance
+
+
 def _should_autogen_data(field, kwargs):
     if field.name in kwargs:
         return False
@@ -364,48 +477,69 @@ def _should_autogen_data(field, kwargs):
     return False
 
 
-def create_model_instance(klass, **kwargs):
+def autogen_fields(instance, kwargs):
+    """
+    Yield the fields of ``instance`` that fixtureless generates values for.
+    """
+    # Don't autogen data that's been provided or if the field can be blank
+    fields = [field for field in instance._meta.fields
+              if _should_autogen_data(field, kwargs)]
+    # Generated in-memory images set their own dimensions
+    dimensions = files.dimension_fields(fields)
+    for field in fields:
+        if field.name in dimensions:
+            continue
+        # Don't set a OneToOneField if it is the pointer to a parent
+        # class in multi-table inheritance. Its fields are taken into
+        # account in the instance.fields list. (instance.local_fields
+        # skips these.)
+        remote_field = getattr(field, 'remote_field', None)
+        if remote_field is None:
+            # Django < 1.10
+            remote_field = getattr(field, 'rel', None)
+        if not getattr(remote_field, 'parent_link', False):
+            yield field
+
+
+def set_val(instance, field, val):
+    name = field.name
+    if field.is_relation and not isinstance(val, models.Model):
+        # A primary key, e.g. sampled by fixtureless.distributions
+        name = field.attname
+    # Not worrying about creating file objects on disk
+    if PY3:
+        try:
+            setattr(instance, name, val)
+        except (FileNotFoundError, OSError):
+            pass
+    else:
+        try:
+            setattr(instance, name, val)
+        except (IOError, OSError, SuspiciousFileOperation):
+            pass
+
+
+def generate_model_instance(klass, kwargs, gen):
     instance = klass(**kwargs)
-    # .local_fields:
-    for field in instance._meta.fields:
-        # Don't autogen data that's been provided or if the field can be blank
-        if _should_autogen_data(field, kwargs):
-            # Don't set a OneToOneField if it is the pointer to a parent
-            # class in multi-table inheritance. Its fields are taken into
-            # account in the instance.fields list. (instance.local_fields
-            # skips these.)
-            is_related_model = False
-            if hasattr(field, 'related'):
-                try:
-                    # Django > 1.8
-                    is_related_model = isinstance(
-                        instance, field.related_model)
-                except AttributeError:
-                    # Django < 1.8
-                    is_related_model = isinstance(
-                        instance, field.related.parent_model)
-            if not (isinstance(field, models.OneToOneField)
-                    and is_related_model):
-                val = Generator(models.Model).get_val(instance=instance, field=field)
-                # Not worrying about creating file objects on disk
-                if PY3:
-                    try:
-                        setattr(instance, field.name, val)
-                    except (FileNotFoundError, OSError):
-                        pass
-                else:
-                    try:
-                        setattr(instance, field.name, val)
-                    except (IOError, OSError, SuspiciousFileOperation):
-                        pass
+    for field in autogen_fields(instance, kwargs):
+        val = gen.get_val(instance=instance, field=field)
+        set_val(instance, field, val)
     return instance
 
 
-def create_form_instance(klass, **kwargs):
+def generate_form_instance(klass, kwargs, gen):
     instance = klass(kwargs)
     for field_name, field_type in instance.fields.items():
         if instance.data.get(field_name):
             continue
-        val = Generator().get_val(instance=instance, field=field_type)
+        val = gen.get_val(instance=instance, field=field_type)
         instance.data[field_name] = val
     return instance
+
+
+def create_model_instance(klass, **kwargs):
+    return generate_model_instance(klass, kwargs, Generator(models.Model))
+
+
+def create_form_instance(klass, **kwargs):
+    return generate_form_instance(klass, kwargs, Generator())
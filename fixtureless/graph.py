@@ -0,0 +1,93 @@
+"""
+Nested object graphs.
+
+``create(Blog, 100, children={'entry_set': 20})`` creates 100 blogs and 20
+entries for each of them.  Children are keyed by the reverse accessor of the
+foreign key pointing at the parent model.  The fan-out may be a count, an
+inclusive ``(low, high)`` range or a callable (see fixtureless.m2m), or a
+dict with the keys ``count``, ``initial`` and ``children`` to go deeper:
+
+    create(Blog, 100, children={
+        'entry_set': {'count': (10, 30), 'initial': {'status': 'live'},
+                      'children': {'comment_set': 5}}})
+
+The graph is built level by level: all the children behind one accessor are
+generated and inserted in bulk together, so the number of queries grows with
+the depth of the spec rather than with the number of objects.
+"""
+import collections
+
+from fixtureless import constants
+from fixtureless import exceptions
+from fixtureless import utils
+from fixtureless.scheduler import Scheduler
+
+
+def reverse_relation(model, accessor):
+    for rel in model._meta.related_objects:
+        if not rel.many_to_many and rel.get_accessor_name() == accessor:
+            return rel
+    return None
+
+
+def _normalize(fan_out):
+    if isinstance(fan_out, dict):
+        return (fan_out.get('count', 1), fan_out.get('initial') or {},
+                fan_out.get('children') or {})
+    return fan_out, {}, {}
+
+
+def check(models, spec):
+    """
+    Raise InvalidArguments unless each accessor in ``spec`` (and in its
+    nested specs) is a reverse foreign key of at least one of ``models``.
+    """
+    for accessor, fan_out in spec.items():
+        rels = [reverse_relation(model, accessor) for model in models]
+        rels = [rel for rel in rels if rel is not None]
+        if not rels:
+            raise exceptions.InvalidArguments(
+                'None of the models have a reverse relation named'
+                ' {}'.format(accessor))
+        count, _, children = _normalize(fan_out)
+        most = None if callable(count) else max(
+            count if isinstance(count, (list, tuple)) else (count,))
+        for rel in rels:
+            if rel.field.unique and most is not None and most > 1:
+                raise exceptions.InvalidArguments(
+                    'Each {} has at most one {}'.format(
+                        rel.model.__name__, accessor))
+        check(set(rel.related_model for rel in rels), children)
+
+
+def populate(parents, spec, batch_size=constants.BATCH_SIZE, gen=None):
+    """
+    Create the children described by ``spec`` for each of ``parents``.
+    :return: The created children, by accessor.
+    """
+    scheduler = Scheduler(batch_size, gen)
+    return _populate(scheduler, parents, spec)
+
+
+def _populate(scheduler, parents, spec):
+    created = {}
+    for accessor, fan_out in spec.items():
+        count, initial, children = _normalize(fan_out)
+        requests = collections.OrderedDict()
+        for parent in parents:
+            rel = reverse_relation(type(parent), accessor)
+            if rel is None:
+                continue
+            n = utils.sample_count(count)
+            if rel.field.unique:
+                n = min(n, 1)
+            kwargs = dict(initial, **{rel.field.name: parent})
+            requests.setdefault(rel.related_model, []).extend(
+                dict(kwargs) for _ in range(n))
+        level = []
+        for model, kwargs_list in requests.items():
+            level.extend(scheduler.build(model, kwargs_list))
+        created[accessor] = level
+        if children and level:
+            _populate(scheduler, level, children)
+    return created
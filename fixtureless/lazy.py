@@ -0,0 +1,119 @@
+"""
+Lazy model instances.
+
+``build(MyModel, lazy=True)`` returns instances whose generated fields are
+left empty until they are first read.  Reading a pending field generates its
+value; reading the primary key (which ``save()``, ``==``, ``hash()`` and the
+serializers all do) generates every pending field at once, so an instance is
+always complete before it is written or compared.  Tests that never touch the
+database skip the values (and uniqueness queries) they never read.
+"""
+from django.db import models
+
+from fixtureless import generator
+
+
+class LazyAttribute(object):
+    """
+    Stands in for the class-level descriptor of a field.  Reads of a field
+    that is pending on the instance generate it; everything else is handed
+    to the wrapped descriptor, so instances built the usual way are not
+    affected.
+    """
+    def __init__(self, field, wrapped):
+        self.field = field
+        self.wrapped = wrapped
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        if self.field.attname in _pending(instance):
+            _generate(instance, self.field)
+            if self.field.primary_key:
+                force(instance)
+            return getattr(instance, self.field.attname)
+        return self.wrapped.__get__(instance, cls)
+
+
+class LazyDataAttribute(LazyAttribute):
+    """
+    Variant for fields whose descriptor also handles assignment, such as
+    ``FileField`` and ``ImageField``.
+    """
+    def __set__(self, instance, value):
+        _pending(instance).pop(self.field.attname, None)
+        self.wrapped.__set__(instance, value)
+
+
+def _pending(instance):
+    return getattr(instance._state, 'fixtureless_pending', {})
+
+
+def _generate(instance, field):
+    _pending(instance).pop(field.attname, None)
+    gen = getattr(instance._state, 'fixtureless_generator', None)
+    if gen is None:
+        gen = generator.Generator(models.Model)
+    val = gen.get_val(instance=instance, field=field)
+    generator.set_val(instance, field, val)
+
+
+def _install(klass, field):
+    """
+    Wrap the descriptor of ``field`` on the class that defines it.  Returns
+    the wrapper, or None when the field has no descriptor to wrap.
+    """
+    for owner in klass.__mro__:
+        wrapped = owner.__dict__.get(field.attname)
+        if wrapped is not None:
+            break
+    else:
+        return None
+    if isinstance(wrapped, LazyAttribute):
+        return wrapped
+    if not hasattr(wrapped, '__get__'):
+        return None
+    if hasattr(wrapped, '__set__'):
+        wrapper = LazyDataAttribute(field, wrapped)
+    else:
+        wrapper = LazyAttribute(field, wrapped)
+    setattr(owner, field.attname, wrapper)
+    return wrapper
+
+
+def force(instance):
+    """
+    Generate every field still pending on ``instance``.
+    """
+    pending = _pending(instance)
+    while pending:
+        _generate(instance, next(iter(pending.values())))
+    return instance
+
+
+def is_pending(instance, field_name):
+    field = instance._meta.get_field(field_name)
+    return field.attname in _pending(instance)
+
+
+def generate_model_instance(klass, kwargs, gen):
+    instance = klass(**kwargs)
+    instance._state.fixtureless_generator = gen
+    pending = instance._state.fixtureless_pending = {}
+    for field in generator.autogen_fields(instance, kwargs):
+        wrapper = _install(klass, field)
+        if wrapper is None:
+            val = gen.get_val(instance=instance, field=field)
+            generator.set_val(instance, field, val)
+            continue
+        # Plain descriptors only run when the attribute is missing from the
+        # instance; data descriptors always run.
+        if not isinstance(wrapper, LazyDataAttribute):
+            instance.__dict__.pop(field.attname, None)
+        pending[field.attname] = field
+    return instance
+
+
+def create_model_instance(klass, **kwargs):
+    return generate_model_instance(
+        klass, kwargs, generator.Generator(models.Model))
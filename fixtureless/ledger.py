@@ -0,0 +1,214 @@
+"""
+A ledger of created rows, for fast teardown.
+
+While a ``Ledger`` is recording, the primary key of every row fixtureless
+inserts (including parents created for foreign keys and rows inserted in
+bulk) is noted per model and database.  ``teardown()`` then deletes exactly
+those rows: children before parents, with one ``DELETE ... WHERE pk IN``
+per chunk, or a ``TRUNCATE`` for tables that only hold ledger rows.  Rows of
+auto-created many-to-many tables pointing at them go first.
+
+In a ``TransactionTestCase`` this replaces flushing every table between
+tests:
+
+    from fixtureless.ledger import LedgerTeardownMixin
+
+    class ChargeTest(LedgerTeardownMixin, TransactionTestCase):
+        ...
+
+Rows created by other code are not tracked; if they reference ledger rows
+the teardown fails like any other delete would.
+"""
+import collections
+import contextlib
+import threading
+
+from django.db import connections, transaction
+
+from fixtureless import constants
+from fixtureless import utils
+
+_active = []
+_lock = threading.Lock()
+
+
+class Ledger(object):
+    def __init__(self):
+        # {alias: {model: OrderedDict of pks}}
+        self.rows = collections.defaultdict(collections.OrderedDict)
+
+    def record(self, instances):
+        for instance in instances:
+            if instance.pk is None:
+                continue
+            alias = instance._state.db
+            pks = self.rows[alias].setdefault(
+                type(instance), collections.OrderedDict())
+            pks[instance.pk] = None
+
+    def pks(self, model, using=None):
+        """
+        The recorded primary keys of ``model``.
+        """
+        if using is None:
+            return [pk for rows in self.rows.values()
+                    for pk in rows.get(model, ())]
+        return list(self.rows[using].get(model, ()))
+
+    def teardown(self, chunk_size=constants.BATCH_SIZE, truncate=True):
+        """
+        Delete the recorded rows and forget them.
+        """
+        for alias, rows in self.rows.items():
+            with transaction.atomic(using=alias):
+                _delete(connections[alias], rows, chunk_size, truncate)
+        self.rows.clear()
+
+
+def _tables(model):
+    """
+    The concrete model and the parents of a multi-table inheritance child,
+    which share its primary key; children first.
+    """
+    models = [model._meta.concrete_model]
+    models.extend(parent for parent in model._meta.get_parent_list()
+                  if parent._meta.concrete_model is parent)
+    return models
+
+
+def _reverse_relations(model):
+    """
+    The foreign keys pointing at ``model``, including those of auto-created
+    many-to-many tables.
+    """
+    return [field for field in model._meta.get_fields(include_hidden=True)
+            if field.is_relation and field.auto_created
+            and not field.concrete and not field.many_to_many]
+
+
+def _delete_in(cursor, table, column, pks, chunk_size):
+    for chunk in utils.chunks(pks, chunk_size):
+        cursor.execute('DELETE FROM {} WHERE {} IN ({})'.format(
+            table, column, ', '.join(['%s'] * len(chunk))), chunk)
+
+
+def _truncatable(connection, table_pks):
+    """
+    The tables that hold nothing but ledger rows.  PostgreSQL only truncates
+    a table along with the tables referencing it, so those have to be
+    truncatable (or empty) as well.
+    """
+    def count(model):
+        return model._base_manager.using(connection.alias).count()
+
+    truncated = set(model for model, pks in table_pks.items()
+                    if count(model) == len(set(pks)))
+    if connection.vendor != 'postgresql':
+        return truncated
+    # Empty tables referencing the candidates can be truncated with them
+    pending = list(truncated)
+    while pending:
+        for rel in _reverse_relations(pending.pop()):
+            other = rel.related_model
+            if other not in truncated and count(other) == 0:
+                truncated.add(other)
+                pending.append(other)
+    # Then drop the tables referenced from outside, until none are left
+    changed = True
+    while changed:
+        changed = False
+        for model in list(truncated):
+            if any(rel.related_model not in truncated
+                   for rel in _reverse_relations(model)):
+                truncated.discard(model)
+                changed = True
+    return truncated
+
+
+def _delete(connection, rows, chunk_size, truncate):
+    # The scheduler inserts through fixtureless.bulk, which records here.
+    from fixtureless.scheduler import order
+
+    quote = connection.ops.quote_name
+    table_pks = collections.OrderedDict()
+    for model in reversed(order(rows)):
+        for table_model in _tables(model):
+            table_pks.setdefault(table_model, []).extend(rows[model])
+
+    truncated = set()
+    if truncate and connection.vendor in ('postgresql', 'sqlite'):
+        truncated = _truncatable(connection, table_pks)
+
+    with connection.cursor() as cursor:
+        for model, pks in table_pks.items():
+            # Rows of auto-created many-to-many tables pointing here
+            for rel in _reverse_relations(model):
+                through = rel.related_model
+                if through._meta.auto_created and through not in truncated:
+                    _delete_in(cursor, quote(through._meta.db_table),
+                               quote(rel.field.column), pks, chunk_size)
+            if model not in truncated:
+                _delete_in(cursor, quote(model._meta.db_table),
+                           quote(model._meta.pk.column), pks, chunk_size)
+        tables = [quote(model._meta.db_table) for model in truncated]
+        if not tables:
+            return
+        if connection.vendor == 'postgresql':
+            cursor.execute('TRUNCATE TABLE {}'.format(', '.join(tables)))
+        else:
+            # SQLite's truncate optimization
+            for table in tables:
+                cursor.execute('DELETE FROM {}'.format(table))
+
+
+def record(instances):
+    """
+    Note ``instances`` (just inserted) in the recording ledgers.
+    """
+    if _active:
+        with _lock:
+            for ledger in _active:
+                ledger.record(instances)
+
+
+def start():
+    ledger = Ledger()
+    with _lock:
+        _active.append(ledger)
+    return ledger
+
+
+def stop(ledger):
+    with _lock:
+        if ledger in _active:
+            _active.remove(ledger)
+
+
+@contextlib.contextmanager
+def recording():
+    ledger = start()
+    try:
+        yield ledger
+    finally:
+        stop(ledger)
+
+
+class LedgerTeardownMixin(object):
+    """
+    For ``TransactionTestCase``: delete the rows fixtureless created during
+    each test instead of flushing the database.  Tests that created nothing
+    through fixtureless are flushed as usual.
+    """
+    def _pre_setup(self):
+        super(LedgerTeardownMixin, self)._pre_setup()
+        self.fixtureless_ledger = start()
+
+    def _fixture_teardown(self):
+        ledger = self.fixtureless_ledger
+        stop(ledger)
+        atomic = any(connection.in_atomic_block
+                     for connection in connections.all())
+        if atomic or not any(ledger.rows.values()):
+            # A TestCase rolling its transaction back, or nothing recorded
+            return super(LedgerTeardownMixin, self)._fixture_teardown()
+        ledger.teardown()
@@ -0,0 +1,231 @@
+"""
+An in-process load driver for form-handling views.
+
+A ``Target`` names a view and the form whose payloads it receives (see
+fixtureless.formdata).  ``LoadDriver`` sends ``requests`` generated
+payloads, spread over its targets by weight, from ``concurrency`` threads,
+at a target ``rate`` (requests per second) or as fast as the views answer,
+and reports the latency percentiles and throughput of each target:
+
+    from fixtureless.loadtest import LoadDriver, Target
+
+    report = LoadDriver([
+        Target('signup', SignupForm, path='/signup/'),
+        Target('search', SearchForm, path='/search/', method='get',
+               weight=4),
+    ], requests=5000, concurrency=8, rate=500).run()
+    print(report)
+    assert report['signup'].percentile(99) < 0.05
+
+Targets with a ``path`` go through the test ``Client`` (URL resolving and
+middleware included, one client per thread); targets with a ``view`` are
+called directly with requests from a ``RequestFactory``.  Payloads are
+generated before the clock starts.  With a target rate, latencies are
+measured from the time each request was due rather than sent, so a view
+falling behind shows in the percentiles instead of slowing the driver.
+Responses with a 4xx or 5xx status and raised exceptions count as errors.
+
+Each thread uses its own database connection: views that read rows created
+by the test need a ``TransactionTestCase``.
+"""
+import bisect
+import collections
+import itertools
+import random
+import threading
+import time
+from timeit import default_timer
+
+from django.db import connections
+from django.test import Client, RequestFactory
+
+from fixtureless import constants
+from fixtureless import exceptions
+from fixtureless import formdata
+
+
+class Target(object):
+    def __init__(self, name, form_class=None, path=None, view=None,
+                 method='post', initial=None, strategies=None, weight=1):
+        if path is None and view is None:
+            raise exceptions.InvalidArguments(
+                'The target {} needs a path or a view.'.format(name))
+        self.name = name
+        self.form_class = form_class
+        self.path = path
+        self.view = view
+        self.method = method.lower()
+        self.initial = initial
+        self.strategies = strategies
+        self.weight = weight
+
+    def payloads(self, count):
+        if self.form_class is None:
+            return [{}] * count
+        return list(formdata.payloads(
+            self.form_class, count, self.initial, self.strategies))
+
+    def send(self, client, factory, data):
+        if self.view is None:
+            return getattr(client, self.method)(self.path, data)
+        request = getattr(factory, self.method)(self.path or '/', data)
+        response = self.view(request)
+        if hasattr(response, 'render') and not response.is_rendered:
+            response.render()
+        return response
+
+
+class TargetStats(object):
+    def __init__(self, name, elapsed):
+        self.name = name
+        self.elapsed = elapsed
+        self.latencies = []
+        self.errors = 0
+
+    @property
+    def count(self):
+        return len(self.latencies)
+
+    @property
+    def throughput(self):
+        """
+        Requests per second over the whole run.
+        """
+        return self.count / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def mean(self):
+        return sum(self.latencies) / self.count if self.count else 0.0
+
+    def percentile(self, percent):
+        """
+        The latency (in seconds) ``percent`` percent of the requests were
+        served within (nearest rank).
+        """
+        if not self.latencies:
+            return 0.0
+        latencies = sorted(self.latencies)
+        rank = int(-(-percent * len(latencies) // 100))
+        return latencies[max(rank, 1) - 1]
+
+
+class Report(object):
+    def __init__(self, stats, elapsed):
+        self.stats = stats
+        self.elapsed = elapsed
+
+    def __getitem__(self, name):
+        return self.stats[name]
+
+    @property
+    def count(self):
+        return sum(stats.count for stats in self.stats.values())
+
+    @property
+    def throughput(self):
+        return self.count / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        percentiles = constants.LOAD_PERCENTILES
+        header = ['target', 'requests', 'errors', 'req/s', 'mean ms'] + \
+            ['p{} ms'.format(percent) for percent in percentiles]
+        rows = [header]
+        for stats in self.stats.values():
+            rows.append(
+                [stats.name, str(stats.count), str(stats.errors),
+                 '{:.1f}'.format(stats.throughput),
+                 '{:.2f}'.format(stats.mean * 1000)] +
+                ['{:.2f}'.format(stats.percentile(percent) * 1000)
+                 for percent in percentiles])
+        widths = [max(len(row[i]) for row in rows)
+                  for i in range(len(header))]
+        return '\n'.join(
+            '  '.join(cell.rjust(width) for cell, width in zip(row, widths))
+            for row in rows)
+
+
+class LoadDriver(object):
+    def __init__(self, targets, requests=100,
+                 concurrency=constants.LOAD_CONCURRENCY, rate=None,
+                 client_class=Client):
+        if not targets:
+            raise exceptions.InvalidArguments('No targets to send to.')
+        if sum(target.weight for target in targets) <= 0:
+            raise exceptions.InvalidArguments(
+                'The target weights must add up to more than 0.')
+        self.targets = targets
+        self.requests = requests
+        self.concurrency = concurrency
+        self.rate = rate
+        self.client_class = client_class
+
+    def plan(self):
+        """
+        The (target, payload) of each request, in the order they are sent.
+        """
+        cumulative = []
+        for target in self.targets:
+            cumulative.append(
+                target.weight + (cumulative[-1] if cumulative else 0))
+        picks = [self.targets[bisect.bisect(
+                     cumulative, random.random() * cumulative[-1])]
+                 for _ in range(self.requests)]
+        payloads = dict(
+            (target, iter(target.payloads(picks.count(target))))
+            for target in self.targets)
+        return [(target, next(payloads[target])) for target in picks]
+
+    def run(self):
+        plan = self.plan()
+        results = []
+        counter = itertools.count()
+        lock = threading.Lock()
+        start = default_timer()
+
+        def work():
+            client = self.client_class()
+            factory = RequestFactory()
+            try:
+                while True:
+                    with lock:
+                        index = next(counter)
+                    if index >= len(plan):
+                        return
+                    results.append(self._send(
+                        client, factory, plan[index], start, index))
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=work, name='fixtureless-load')
+                   for _ in range(min(self.concurrency, len(plan)) or 1)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = default_timer() - start
+
+        stats = dict((target.name, TargetStats(target.name, elapsed))
+                     for target in self.targets)
+        for name, latency, ok in results:
+            stats[name].latencies.append(latency)
+            if not ok:
+                stats[name].errors += 1
+        ordered = [(target.name, stats[target.name])
+                   for target in self.targets]
+        return Report(collections.OrderedDict(ordered), elapsed)
+
+    def _send(self, client, factory, request, start, index):
+        target, data = request
+        due = None
+        if self.rate:
+            due = start + float(index) / self.rate
+            delay = due - default_timer()
+            if delay > 0:
+                time.sleep(delay)
+        sent = default_timer()
+        try:
+            ok = target.send(client, factory, data).status_code < 400
+        except Exception:
+            ok = False
+        latency = default_timer() - (sent if due is None else due)
+        return target.name, latency, ok
@@ -0,0 +1,109 @@
+"""
+Bulk population of many-to-many relations.
+
+``create(..., m2m={'tags': 3})`` links every created instance to 3 ``tags``.
+The fan-out may also be an inclusive ``(low, high)`` range or a callable
+returning a count, e.g. ``m2m={'tags': (0, 5)}``.  Targets are picked from
+existing rows, and the shortfall is created in bulk.  The rows of the
+through table go in with one ``bulk_create`` per relation and batch instead
+of one ``.add()`` per object.  The other columns of custom ``through``
+models are generated with the Scheduler, a field and batch at a time.
+"""
+import collections
+import random
+
+from fixtureless import constants
+from fixtureless import exceptions
+from fixtureless import generator
+from fixtureless import utils
+from fixtureless.scheduler import Scheduler
+
+
+def m2m_field(model, name):
+    for field in model._meta.many_to_many:
+        if field.name == name:
+            return field
+    return None
+
+
+def check(models, spec):
+    """
+    Raise InvalidArguments unless each field in ``spec`` is a many-to-many
+    field of at least one of ``models``.
+    """
+    for name in spec:
+        if not any(m2m_field(model, name) for model in models):
+            raise exceptions.InvalidArguments(
+                'None of the models have a many-to-many field named'
+                ' {}'.format(name))
+
+
+def populate(instances, spec, batch_size=constants.BATCH_SIZE):
+    by_model = collections.OrderedDict()
+    for instance in instances:
+        by_model.setdefault(type(instance), []).append(instance)
+    check(by_model, spec)
+    for model, sources in by_model.items():
+        for name, fan_out in spec.items():
+            field = m2m_field(model, name)
+            if field is not None:
+                _populate_field(field, sources, fan_out, batch_size)
+
+
+def _is_symmetrical(field):
+    return (getattr(field.remote_field, 'symmetrical', False)
+            and generator.related_model(field) is field.model)
+
+
+def _targets(model, needed, batch_size):
+    limit = max(needed, constants.M2M_TARGETS)
+    pks = list(model._base_manager.values_list('pk', flat=True)[:limit])
+    if len(pks) < needed:
+        shortfall = needed - len(pks)
+        created = Scheduler(batch_size).build(model, [None] * shortfall)
+        pks.extend(instance.pk for instance in created)
+    return pks
+
+
+def _populate_field(field, sources, fan_out, batch_size):
+    target = generator.related_model(field)
+    through = field.remote_field.through
+    source_name = field.m2m_field_name()
+    target_name = field.m2m_reverse_field_name()
+    symmetrical = _is_symmetrical(field)
+
+    counts = [utils.sample_count(fan_out) for _ in sources]
+    if not any(counts):
+        return
+    # Self-referencing relations never link an instance to itself.
+    needed = max(counts) + (1 if target is field.model else 0)
+    targets = _targets(target, needed, batch_size)
+
+    pairs = []
+    seen = set()
+    for source, count in zip(sources, counts):
+        candidates = [pk for pk in targets if pk != source.pk]
+        for target_pk in random.sample(candidates, count):
+            pair = (source.pk, target_pk)
+            if symmetrical:
+                if pair in seen:
+                    continue
+                seen.add(pair)
+                seen.add((target_pk, source.pk))
+                pairs.append((target_pk, source.pk))
+            pairs.append(pair)
+
+    if not through._meta.auto_created:
+        # The other columns are generated a field at a time, and unique
+        # values checked once per batch.
+        sources_by_pk = dict((source.pk, source) for source in sources)
+        Scheduler(batch_size).build(through, [
+            {source_name: sources_by_pk[source_pk],
+             target_name: target(pk=target_pk)}
+            for source_pk, target_pk in pairs])
+        return
+    source_attname = through._meta.get_field(source_name).attname
+    target_attname = through._meta.get_field(target_name).attname
+    rows = [through(**{source_attname: source_pk, target_attname: target_pk})
+            for source_pk, target_pk in pairs]
+    through._base_manager.bulk_create(rows, batch_size=batch_size)
@@ -0,0 +1,121 @@
+"""
+Size-targeted payloads.
+
+The string generators cap values at DEFAULT_CHARFIELD_MAX_LEN characters and
+JSON values are a handful of short keys, which is too small to exercise
+TOAST, compression or row-width behaviour.  These strategies produce values
+of a target size instead:
+
+    from fixtureless import payloads
+
+    create(Document, 1000, strategies={
+        'body': payloads.Text((4096, 65536)),
+        'meta': payloads.JSON(2048, depth=3, width=4)})
+
+Sizes (in bytes) take the forms of a fan-out (see fixtureless.m2m): a
+number, an inclusive ``(low, high)`` range or a callable.  Values are cut
+from a set of random ASCII blocks built once per process rather than
+generated character by character, so megabytes cost no more than a few
+string joins.  Character fields never exceed their ``max_length``.
+"""
+import json
+import random
+import string
+
+from fixtureless import constants
+from fixtureless import utils
+
+# Characters JSON encodes as themselves, so sizes are predictable.
+JSON_CHARSET = string.ascii_letters + string.digits + ' '
+
+_blocks = {}
+
+
+def blocks(block_size=constants.PAYLOAD_BLOCK_SIZE,
+           count=constants.PAYLOAD_BLOCKS,
+           char_set=constants.CHARFIELD_CHARSET_ASCII):
+    """
+    The shared random blocks, built on first use.
+    """
+    key = (block_size, count, char_set)
+    if key not in _blocks:
+        _blocks[key] = [utils.random_str(block_size, char_set)
+                        for _ in range(count)]
+    return _blocks[key]
+
+
+def text(size, block_size=constants.PAYLOAD_BLOCK_SIZE,
+         count=constants.PAYLOAD_BLOCKS,
+         char_set=constants.CHARFIELD_CHARSET_ASCII):
+    """
+    A string of exactly ``size`` characters (and bytes) made of randomly
+    picked blocks, starting at a random offset.
+    """
+    if size <= 0:
+        return ''
+    pool = blocks(block_size, count, char_set)
+    offset = random.randrange(block_size)
+    needed = (size + offset) // block_size + 1
+    chunk = ''.join(random.choice(pool) for _ in range(needed))
+    return chunk[offset:offset + size]
+
+
+def document(size, depth=2, width=4):
+    """
+    A dict nested ``depth`` levels deep with ``width`` keys per level, whose
+    string leaves are sized so the JSON encoding is about ``size`` bytes.
+    """
+    def skeleton(level):
+        if level == depth:
+            return None
+        return dict(('k{}'.format(i), skeleton(level + 1))
+                    for i in range(width))
+
+    def fill(node, leaf_size):
+        for key, child in node.items():
+            if child is None:
+                node[key] = text(leaf_size, char_set=JSON_CHARSET)
+            else:
+                fill(child, leaf_size)
+        return node
+
+    if depth == 0:
+        return text(size, char_set=JSON_CHARSET)
+    root = skeleton(0)
+    # Size of the structure with empty strings: ``null`` is 4 bytes and
+    # ``""`` is 2.
+    overhead = len(json.dumps(root)) - 2 * width ** depth
+    leaf_size = max(0, (size - overhead) // width ** depth)
+    return fill(root, leaf_size)
+
+
+class Text(object):
+    """
+    Strategy for char and text fields.
+    """
+    def __init__(self, size, block_size=constants.PAYLOAD_BLOCK_SIZE,
+                 count=constants.PAYLOAD_BLOCKS):
+        self.size = size
+        self.block_size = block_size
+        self.count = count
+
+    def __call__(self, **kwargs):
+        size = utils.sample_count(self.size)
+        max_length = getattr(kwargs['field'], 'max_length', None)
+        if max_length is not None:
+            size = min(size, max_length)
+        return text(size, self.block_size, self.count)
+
+
+class JSON(object):
+    """
+    Strategy for JSON fields.
+    """
+    def __init__(self, size, depth=2, width=4):
+        self.size = size
+        self.depth = depth
+        self.width = width
+
+    def __call__(self, **kwargs):
+        return document(
+            utils.sample_count(self.size), self.depth, self.width)
@@ -0,0 +1,103 @@
+"""
+Pipelined generation and insertion.
+
+``create(..., pipeline=True)`` overlaps the two halves of a large create: the
+calling thread generates the next batch of instances while a consumer thread
+inserts the previous one on its own database connection.  A bounded queue
+between them keeps at most ``depth`` batches in memory.
+
+Because the consumer commits on a separate connection, pipelined creates
+cannot run inside an atomic block (e.g. a ``TestCase``).  On in-memory
+SQLite databases the batches are inserted by the calling thread instead.
+"""
+import threading
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from fixtureless import bulk
+from fixtureless import constants
+from fixtureless import exceptions
+from fixtureless import fastload
+from fixtureless import signals
+from fixtureless import utils
+
+
+def _shares_cache(connection):
+    """
+    Whether the connections to ``connection``'s database share one cache,
+    as with in-memory SQLite databases (e.g. test databases).  There, only
+    one connection writes at a time, and the others fail instead of waiting.
+    """
+    return connection.vendor == 'sqlite' and connection.creation \
+        .is_in_memory_db(connection.settings_dict['NAME'])
+
+
+class Pipeline(object):
+    def __init__(self, batch_size=constants.BATCH_SIZE,
+                 depth=constants.PIPELINE_DEPTH, using=DEFAULT_DB_ALIAS):
+        self.batch_size = batch_size
+        self.depth = depth
+        self.using = using
+
+    def save_instances(self, iterable):
+        if connections[self.using].in_atomic_block:
+            raise exceptions.InvalidArguments(
+                'Pipelined creates insert on their own connection and cannot'
+                ' be used inside an atomic block.')
+        if _shares_cache(connections[self.using]):
+            return self._save_inline(iterable)
+        batches = queue.Queue(maxsize=self.depth)
+        errors = []
+        consumer = threading.Thread(
+            target=self._consume, args=(batches, errors, signals.current()),
+            name='fixtureless-pipeline')
+        consumer.daemon = True
+        consumer.start()
+        saved = []
+        try:
+            for batch in utils.chunks(iterable, self.batch_size):
+                if errors:
+                    break
+                batches.put(batch)
+                saved.extend(batch)
+        finally:
+            batches.put(None)
+            consumer.join()
+        if errors:
+            raise errors[0]
+        return saved
+
+    def _save_inline(self, iterable):
+        saved = []
+        for batch in utils.chunks(iterable, self.batch_size):
+            with transaction.atomic(using=self.using):
+                bulk.insert(batch, using=self.using)
+            saved.extend(batch)
+        return saved
+
+    def _consume(self, batches, errors, dispatch):
+        try:
+            try:
+                fastload.prepare(connections[self.using])
+            except Exception as exc:
+                errors.append(exc)
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    return
+                # Keep draining after a failure so the producer never blocks.
+                if errors:
+                    continue
+                try:
+                    with signals.activate(dispatch):
+                        with transaction.atomic(using=self.using):
+                            bulk.insert(batch, using=self.using)
+                except Exception as exc:
+                    errors.append(exc)
+        finally:
+            connections[self.using].close()
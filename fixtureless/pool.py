@@ -0,0 +1,146 @@
+"""
+An optional pool of pre-generated field values.
+
+Generating long random strings, JSON documents and decimals is CPU work that
+otherwise sits on the critical path of every ``create()``.  When the pool is
+enabled a background thread keeps one bounded ring buffer per kind of value
+topped up, mostly while the main thread is blocked on database I/O, and the
+generators pop from those buffers instead of building values inline.
+
+    from fixtureless import pool
+
+    with pool.enabled():
+        create(MyModel, 1000)
+"""
+import atexit
+import collections
+import contextlib
+import threading
+
+from fixtureless import constants
+
+
+class ValuePool(object):
+    def __init__(self, size=constants.POOL_SIZE, low_water=None):
+        self.size = size
+        if low_water is None:
+            low_water = min(constants.POOL_LOW_WATER, size // 2)
+        self.low_water = low_water
+        self._buffers = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name='fixtureless-pool')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def get(self, func, *args):
+        """
+        Return a value equivalent to ``func(*args)``.  The first request for
+        a given ``(func, args)`` registers a buffer for it; later requests
+        are served from that buffer and fall back to calling ``func`` when it
+        has run dry.
+        """
+        key = (func,) + args
+        try:
+            buf = self._buffers[key]
+        except KeyError:
+            with self._lock:
+                self._buffers.setdefault(
+                    key, collections.deque(maxlen=self.size))
+            self._wakeup.set()
+            return func(*args)
+        try:
+            val = buf.popleft()
+        except IndexError:
+            val = func(*args)
+        if len(buf) <= self.low_water:
+            self._wakeup.set()
+        return val
+
+    def fill(self):
+        """
+        Top every buffer up to its capacity and return how many values were
+        generated.  Bails out early when the pool is being stopped.
+        """
+        with self._lock:
+            buffers = list(self._buffers.items())
+        generated = 0
+        for key, buf in buffers:
+            func, args = key[0], key[1:]
+            while len(buf) < self.size:
+                if self._stopping.is_set():
+                    return generated
+                buf.append(func(*args))
+                generated += 1
+        return generated
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wakeup.wait(constants.POOL_REFILL_INTERVAL)
+            self._wakeup.clear()
+            self.fill()
+
+
+_pool = None
+
+
+def get_pool():
+    return _pool
+
+
+def enable(size=constants.POOL_SIZE, low_water=None):
+    """
+    Start a fresh pool (replacing any running one) and return it.
+    """
+    global _pool
+    disable()
+    _pool = ValuePool(size, low_water)
+    _pool.start()
+    return _pool
+
+
+def disable():
+    global _pool
+    if _pool is not None:
+        _pool.stop()
+        _pool = None
+
+
+@contextlib.contextmanager
+def enabled(size=constants.POOL_SIZE, low_water=None):
+    try:
+        yield enable(size, low_water)
+    finally:
+        disable()
+
+
+def draw(func, *args):
+    """
+    Return ``func(*args)``, taken from the pool when one is enabled.
+    """
+    active = _pool
+    if active is None:
+        return func(*args)
+    return active.get(func, *args)
+
+
+atexit.register(disable)
@@ -0,0 +1,140 @@
+"""
+Table profiles.
+
+A profile holds per-column statistics in the shape of PostgreSQL's
+``pg_stats`` view: ``null_frac``, ``n_distinct``, ``avg_width``,
+``most_common_vals`` and ``most_common_freqs``.  Read one from a production
+database (or a JSON export of it) and use its strategies so seeded tables
+have the same value shape, and queries against them get similar plans:
+
+    from fixtureless.profiles import Profile
+
+    profile = Profile.from_pg_stats([Charge], using='production')
+    profile.dump('charge_profile.json')
+
+    profile = Profile.load('charge_profile.json')
+    create(Charge, 100000, strategies=profile.strategies(Charge, rows=100000))
+
+Primary keys, unique fields and relations keep their usual generators (see
+fixtureless.distributions for the latter).
+"""
+import bisect
+import json
+import random
+
+from django.db import DEFAULT_DB_ALIAS, connections, models
+
+from fixtureless import generator
+from fixtureless import payloads
+
+PG_STATS_SQL = (
+    'SELECT attname, null_frac, n_distinct, avg_width,'
+    ' most_common_vals::text::text[], most_common_freqs'
+    ' FROM pg_stats'
+    ' WHERE schemaname = current_schema() AND tablename = %s')
+STATS_COLUMNS = ('null_frac', 'n_distinct', 'avg_width', 'most_common_vals',
+                 'most_common_freqs')
+
+
+class ColumnStrategy(object):
+    """
+    Generates values of ``field`` following ``stats``.  Values that are not
+    one of the most common are drawn from a set of ``n_distinct`` generated
+    ones; ``rows`` resolves negative (relative) ``n_distinct`` values.
+    """
+    def __init__(self, field, stats, rows=None):
+        self.field = field
+        self.null_frac = (stats.get('null_frac') or 0) if field.null else 0
+        self.mcvs = [field.to_python(val)
+                     for val in stats.get('most_common_vals') or ()]
+        self.cumulative = []
+        total = 0
+        for freq in stats.get('most_common_freqs') or ():
+            total += freq
+            self.cumulative.append(total)
+        n_distinct = stats.get('n_distinct') or 0
+        if n_distinct < 0 and rows:
+            n_distinct = -n_distinct * rows
+        # None: every other value is new
+        self.distinct = None
+        if n_distinct > 0:
+            self.distinct = max(0, int(round(n_distinct)) - len(self.mcvs))
+        self.avg_width = stats.get('avg_width')
+        self._pool = []
+        self._generator = generator.Generator(models.Model)
+
+    def __call__(self, **kwargs):
+        point = random.random()
+        if point < self.null_frac:
+            return None
+        point -= self.null_frac
+        if self.mcvs:
+            if self.distinct == 0:
+                # The most common values are all there is.
+                point = random.random() * self.cumulative[-1]
+            if point < self.cumulative[-1]:
+                return self.mcvs[bisect.bisect_right(self.cumulative, point)]
+        if self.distinct is None or len(self._pool) < self.distinct:
+            val = self._new_val(**kwargs)
+            if self.distinct is not None:
+                self._pool.append(val)
+            return val
+        return random.choice(self._pool)
+
+    def _new_val(self, **kwargs):
+        if self.avg_width and isinstance(
+                self.field, (models.CharField, models.TextField)):
+            # avg_width includes the (usually 1 byte) varlena header.
+            width = max(1, self.avg_width - 1)
+            size = random.randint(max(1, width // 2), width + width // 2)
+            if self.field.max_length is not None:
+                size = min(size, self.field.max_length)
+            return payloads.text(size)
+        return self._generator.get_func(self.field)(**kwargs)
+
+
+class Profile(object):
+    def __init__(self, tables=None):
+        # {db_table: {column: stats}}
+        self.tables = tables or {}
+
+    @classmethod
+    def from_pg_stats(cls, models_list, using=DEFAULT_DB_ALIAS):
+        """
+        Read the statistics of the tables of ``models_list`` from pg_stats.
+        Run ANALYZE first if they may be stale.
+        """
+        tables = {}
+        with connections[using].cursor() as cursor:
+            for model in models_list:
+                table = model._meta.db_table
+                cursor.execute(PG_STATS_SQL, [table])
+                tables[table] = dict(
+                    (row[0], dict(zip(STATS_COLUMNS, row[1:])))
+                    for row in cursor.fetchall())
+        return cls(tables)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def dump(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.tables, f, indent=2, sort_keys=True)
+
+    def strategies(self, model, rows=None):
+        """
+        Strategies for the profiled fields of ``model``, keyed by name.
+        :param rows: The number of rows to be created, which resolves
+            negative ``n_distinct`` values.
+        """
+        columns = self.tables.get(model._meta.db_table, {})
+        strategies = {}
+        for field in model._meta.fields:
+            if field.primary_key or field.unique or field.is_relation:
+                continue
+            if field.column in columns:
+                strategies[field.name] = ColumnStrategy(
+                    field, columns[field.column], rows)
+        return strategies
@@ -0,0 +1,100 @@
+"""
+Prototype copies for large batches of near-identical instances.
+
+``create(Charge, 10000, {'currency': 'usd'}, prototype=True)`` generates the
+first instance field by field as usual and makes the others shallow copies
+of it (a ``__dict__`` copy and a fresh model state).  Only the fields that
+must differ are generated again for each copy: the primary key, the other
+unique fields and the ones named in ``vary``:
+
+    create(Charge, 10000, prototype=True, vary=['amount', 'created'])
+
+Each field is regenerated for ``batch_size`` copies at a time, so unique
+values are checked with one query per batch (see Generator.get_vals).
+Related objects that are not regenerated, e.g. the parent of a non-unique
+foreign key, are shared by the copies just as the field values are.
+"""
+import copy as _copy
+
+from django.db.models.base import ModelState
+from django.db.models.fields.files import FieldFile
+
+from fixtureless import constants
+from fixtureless import exceptions
+from fixtureless import generator
+from fixtureless import utils
+
+
+def check(model, vary):
+    """
+    Raise InvalidArguments unless each name in ``vary`` is a concrete field
+    of ``model``.
+    """
+    names = set(field.name for field in model._meta.fields)
+    for name in vary:
+        if name not in names:
+            raise exceptions.InvalidArguments(
+                '{} has no field named {}'.format(model.__name__, name))
+
+
+def varying_fields(instance, kwargs, vary=()):
+    """
+    The generated fields of ``instance`` that copies generate again.
+    """
+    return [field for field in generator.autogen_fields(instance, kwargs)
+            if field.unique or field.name in vary]
+
+
+def copy(prototype):
+    """
+    A shallow copy of the unsaved instance ``prototype``.
+    """
+    instance = prototype.__class__.__new__(prototype.__class__)
+    instance.__dict__ = prototype.__dict__.copy()
+    for name, val in instance.__dict__.items():
+        # File values point back at their instance
+        if isinstance(val, FieldFile):
+            instance.__dict__[name] = _copy.copy(val)
+    instance._state = ModelState()
+    instance._state.fields_cache = dict(prototype._state.fields_cache)
+    return instance
+
+
+def generate_copies(klass, kwargs_iter, gen, vary=(),
+                    batch_size=constants.BATCH_SIZE):
+    """
+    Yield an instance of ``klass`` per kwargs, copying one prototype per
+    distinct kwargs dict.
+    """
+    check(klass, vary)
+    prototypes = {}
+    for batch in utils.chunks(kwargs_iter, batch_size):
+        copies = []
+        for kwargs in batch:
+            key = id(kwargs)
+            if key not in prototypes:
+                kwargs = kwargs or {}
+                instance = generator.generate_model_instance(
+                    klass, kwargs, gen)
+                prototypes[key] = (
+                    instance, varying_fields(instance, kwargs, vary))
+                copies.append((instance, ()))
+                continue
+            prototype, fields = prototypes[key]
+            copies.append((copy(prototype), fields))
+        _regenerate(copies, gen)
+        for instance, _ in copies:
+            yield instance
+
+
+def _regenerate(copies, gen):
+    by_field = {}
+    for instance, fields in copies:
+        for field in fields:
+            by_field.setdefault(field, []).append(instance)
+    for field, instances in by_field.items():
+        vals = gen.get_vals(field, instances)
+        for instance, val in zip(instances, vals):
+            if field.is_relation:
+                instance._state.fields_cache.pop(field.get_cache_name(), None)
+            generator.set_val(instance, field, val)
@@ -0,0 +1,77 @@
+"""
+A test runner that seeds the test databases once, before they are cloned.
+
+With ``manage.py test --parallel N`` every worker runs on its own clone of
+the test database, so base data created in ``setUpTestData`` or a data
+migration is generated N times.  ``SeededTestRunner`` calls a seed function
+once, right after the test databases are created and before the clones are
+made (a file copy on SQLite, a template copy on PostgreSQL), so the workers
+inherit the rows instead:
+
+    # settings.py
+    TEST_RUNNER = 'fixtureless.runner.SeededTestRunner'
+    FIXTURELESS_TEST_SEED = 'shop.seeds.base_data'
+
+    # shop/seeds.py
+    def base_data():
+        Dataset({Customer: 1, Charge: 20}).top_up(scale=100)
+
+The seed function takes no arguments.  It may be given as a callable or a
+dotted path, in the setting or as the runner's ``seed`` attribute.  With
+``--keepdb`` it runs against the kept database again, so it should only
+create what is missing (see ``Dataset.top_up``).
+"""
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+from django.utils.module_loading import import_string
+
+
+class SeededTestRunner(DiscoverRunner):
+    seed = None
+
+    def get_seed(self):
+        seed = self.seed or getattr(settings, 'FIXTURELESS_TEST_SEED', None)
+        if seed is not None and not callable(seed):
+            seed = import_string(seed)
+        return seed
+
+    def setup_databases(self, **kwargs):
+        # Create the databases without their clones, seed, then clone.
+        parallel = self.parallel
+        self.parallel = 1
+        try:
+            old_config = super(SeededTestRunner, self).setup_databases(
+                **kwargs)
+        finally:
+            self.parallel = parallel
+        created = [connection for connection, _, first in old_config
+                   if first]
+        self.seed_databases(created)
+        if parallel > 1:
+            self.clone_databases(created, parallel)
+        return old_config
+
+    def seed_databases(self, connections):
+        """
+        Run the seed and refresh the contents ``serialized_rollback``
+        restores, so that they include the seeded rows.
+        :param connections: The connections of the created test databases.
+        """
+        seed = self.get_seed()
+        if seed is None:
+            return
+        seed()
+        for connection in connections:
+            test_settings = connection.settings_dict.get('TEST', {})
+            if test_settings.get('SERIALIZE', True):
+                connection._test_serialized_contents = \
+                    connection.creation.serialize_db_to_string()
+
+    def clone_databases(self, connections, parallel):
+        for connection in connections:
+            for index in range(parallel):
+                connection.creation.clone_test_db(
+                    suffix=str(index + 1),
+                    verbosity=self.verbosity,
+                    keepdb=self.keepdb,
+                )
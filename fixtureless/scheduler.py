@@ -0,0 +1,150 @@
+"""
+Dependency-aware scheduling for multi-model creates.
+
+``create(..., schedule=True)`` merges the requests made for each model and
+reads the foreign key graph between them.  Referenced models are created
+before the models referencing them, each model's instances are inserted in
+bulk, and foreign keys are resolved once per field instead of once per
+instance:
+
+* non-unique foreign keys point at the last instance created for the target
+  model (requested in the same call, or else the latest existing row);
+* unique foreign keys and one-to-one fields get new parents, built and
+  inserted in bulk ahead of their children;
+* foreign keys to the model itself that can't point at an existing row are
+  left null, or else point at the instance itself (see
+  fixtureless.trees for hierarchies).
+
+Objects are still returned in the order the caller asked for them.
+"""
+import collections
+
+from django.db.models import Model
+
+from fixtureless import bulk
+from fixtureless import constants
+from fixtureless import generator
+
+
+def dependencies(model):
+    """
+    The models ``model`` references through foreign keys, other than itself.
+    """
+    related = set(generator.related_model(field)
+                  for field in model._meta.fields if field.is_relation)
+    related.discard(model)
+    return related
+
+
+def order(models):
+    """
+    Sort ``models`` so that referenced models come before the models that
+    reference them.  Otherwise the given order is kept, which is also the
+    fallback for reference cycles.
+    """
+    remaining = list(models)
+    ordered = []
+    while remaining:
+        for model in remaining:
+            if not dependencies(model).intersection(remaining):
+                break
+        else:
+            model = remaining[0]
+        remaining.remove(model)
+        ordered.append(model)
+    return ordered
+
+
+class Scheduler(object):
+    def __init__(self, batch_size=constants.BATCH_SIZE, gen=None):
+        self.batch_size = batch_size
+        self.generator = gen or generator.Generator(Model)
+        self._parents = {}
+
+    def create(self, factory, *args):
+        requests = collections.OrderedDict()
+        position = 0
+        for spec in factory._specs(*args):
+            model, kwargs_iter = factory._resolve_args(*spec)
+            for kwargs in kwargs_iter:
+                requests.setdefault(model, []).append((position, kwargs))
+                position += 1
+
+        objs = [None] * position
+        for model in order(requests):
+            entries = requests[model]
+            instances = self.build(model, [kwargs for _, kwargs in entries])
+            for (position, _), instance in zip(entries, instances):
+                objs[position] = instance
+        return objs
+
+    def build(self, model, kwargs_list):
+        """
+        Build and bulk insert one instance of ``model`` per kwargs dict.
+        """
+        kwargs_list = [dict(kwargs or {}) for kwargs in kwargs_list]
+        instances = [model(**kwargs) for kwargs in kwargs_list]
+        fields = [list(generator.autogen_fields(instance, kwargs))
+                  for instance, kwargs in zip(instances, kwargs_list)]
+
+        gen = self.generator
+        children = collections.OrderedDict()
+        columns = collections.OrderedDict()
+        loops = []
+        for instance, instance_fields in zip(instances, fields):
+            for field in instance_fields:
+                if field.is_relation and gen.get_strategy(field) is None:
+                    if generator.related_model(field) is model:
+                        loops.append((instance, field))
+                    else:
+                        children.setdefault(field, []).append(instance)
+                else:
+                    columns.setdefault(field, []).append(instance)
+        for field, field_children in children.items():
+            for child, parent in zip(field_children,
+                                     self._parents_for(field, field_children)):
+                generator.set_val(child, field, parent)
+
+        for field, field_instances in columns.items():
+            vals = gen.get_vals(field, field_instances)
+            for instance, val in zip(field_instances, vals):
+                generator.set_val(instance, field, val)
+        # After the columns, which include generated primary keys.
+        for instance, field in loops:
+            generator.set_val(
+                instance, field, self._self_reference(instance, field))
+
+        bulk.insert(instances, batch_size=self.batch_size)
+        if instances:
+            self._parents[model] = instances[-1]
+        return instances
+
+    def _parents_for(self, field, children):
+        target = generator.related_model(field)
+        if field.unique:
+            return self.build(target, [None] * len(children))
+        return [self.parent(target)] * len(children)
+
+    def _self_reference(self, instance, field):
+        model = generator.related_model(field)
+        if not field.unique:
+            parent = self._parents.get(model)
+            if parent is None:
+                parent = model.objects.order_by('-pk').first()
+            if parent is not None:
+                return parent
+        return generator.self_reference(instance, field)
+
+    def parent(self, model):
+        """
+        The instance non-unique foreign keys to ``model`` should point at.
+        """
+        try:
+            return self._parents[model]
+        except KeyError:
+            pass
+        instance = model.objects.order_by('-pk').first()
+        if instance is None:
+            instance = self.build(model, [None])[0]
+        self._parents[model] = instance
+        return instance
@@ -0,0 +1,143 @@
+"""
+Model signal muting and batched dispatch.
+
+``create(..., signals=False)`` mutes the model signals (``pre_save``,
+``post_save``, ``post_init`` and so on) sent while fixtureless creates the
+requested objects and their parents, so receivers doing cache invalidation
+or search indexing don't run once per generated row.
+
+``create(..., signals='batched')`` mutes them as well, and then sends one
+``post_create`` per model and ``batch_size`` created instances instead:
+
+    from fixtureless.signals import post_create
+
+    @receiver(post_create, sender=Product)
+    def index_products(sender, instances, using, **kwargs):
+        search.bulk_index(instances)
+
+Signals sent from other threads are not affected.  Model signals are only
+patched while some thread is muted.
+"""
+import collections
+import contextlib
+import threading
+
+from django.db.models import signals as model_signals
+from django.dispatch import Signal
+
+from fixtureless import constants
+from fixtureless import utils
+
+# Sent with ``instances`` (a list) and ``using`` (the database alias).
+post_create = Signal()
+
+MODEL_SIGNALS = (
+    model_signals.pre_init, model_signals.post_init,
+    model_signals.pre_save, model_signals.post_save,
+    model_signals.pre_delete, model_signals.post_delete,
+    model_signals.m2m_changed)
+
+_local = threading.local()
+_lock = threading.Lock()
+# {signal: its own ``send`` attribute before muting}, while installed
+_originals = {}
+_users = 0
+
+
+class Dispatch(object):
+    """
+    The instances created while muted, when batching.
+    """
+    def __init__(self, batched=False, batch_size=constants.BATCH_SIZE):
+        self.batched = batched
+        self.batch_size = batch_size
+        self.created = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def add(self, model, instances, using):
+        if self.batched:
+            with self.lock:
+                self.created.setdefault((model, using), []).extend(instances)
+
+    def send(self):
+        for (model, using), instances in self.created.items():
+            for batch in utils.chunks(instances, self.batch_size):
+                post_create.send(sender=model, instances=batch, using=using)
+
+
+def current():
+    return getattr(_local, 'dispatch', None)
+
+
+def _mute(signal):
+    send = signal.send
+
+    def muted_send(sender, **named):
+        dispatch = current()
+        if dispatch is None:
+            return send(sender, **named)
+        if signal is model_signals.post_save and named.get('created'):
+            dispatch.add(sender, [named['instance']], named.get('using'))
+        return []
+    signal.send = muted_send
+
+
+def _install():
+    global _users
+    with _lock:
+        if not _users:
+            for signal in MODEL_SIGNALS:
+                _originals[signal] = signal.__dict__.get('send')
+                _mute(signal)
+        _users += 1
+
+
+def _uninstall():
+    global _users
+    with _lock:
+        _users -= 1
+        if _users:
+            return
+        for signal, send in _originals.items():
+            if send is None:
+                del signal.send
+            else:
+                signal.send = send
+        _originals.clear()
+
+
+@contextlib.contextmanager
+def activate(dispatch):
+    """
+    Mute model signals on this thread for ``dispatch``, e.g. in a thread
+    inserting on behalf of a muted create.
+    """
+    _install()
+    previous = current()
+    _local.dispatch = dispatch
+    try:
+        yield dispatch
+    finally:
+        _local.dispatch = previous
+        _uninstall()
+
+
+@contextlib.contextmanager
+def muted(batched=False, batch_size=constants.BATCH_SIZE):
+    """
+    Mute model signals on this thread.  With ``batched``, send
+    ``post_create`` for the created instances once the block succeeds.
+    """
+    with activate(Dispatch(batched, batch_size)) as dispatch:
+        yield dispatch
+    dispatch.send()
+
+
+def created(instances, using):
+    """
+    Record instances inserted without ``save()`` (``bulk_create`` sends no
+    ``post_save``).
+    """
+    dispatch = current()
+    if dispatch is not None and instances:
+        dispatch.add(type(instances[0]), instances, using)
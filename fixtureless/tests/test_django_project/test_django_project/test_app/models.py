@@ -57,3 +57,57 @@ class ModelThree(models.Model):
     json_field_list = JSONField(default=list)
     json_field_dict = JSONField(default=dict)
     json_field_callable = JSONField(default=supply_default)
+
+
+class ModelFour(models.Model):
+    char_field = models.CharField(max_length=20)
+    many_to_many = models.ManyToManyField(
+        ModelOne, related_name='modelfour_m2m')
+    symmetrical = models.ManyToManyField('self')
+
+
+class ModelFive(models.Model):
+    foreign_key = models.ForeignKey(
+        ModelTwo, related_name='modelfive_fk', on_delete=models.CASCADE)
+    char_field = models.CharField(max_length=20)
+
+
+class ModelSix(models.Model):
+    parent = models.ForeignKey(
+        'self', null=True, related_name='children', on_delete=models.CASCADE)
+    sibling = models.OneToOneField(
+        'self', related_name='+', on_delete=models.CASCADE)
+    char_field = models.CharField(max_length=20)
+
+
+class ModelSeven(models.Model):
+    parent = models.ForeignKey(
+        'self', related_name='children', on_delete=models.CASCADE)
+
+
+class ModelEight(models.Model):
+    char_field = models.CharField(max_length=20)
+
+
+class ModelNine(ModelEight):
+    integer_field = models.IntegerField()
+
+
+class ModelTen(ModelNine):
+    foreign_key = models.ForeignKey(
+        ModelFive, related_name='modelten_fk', on_delete=models.CASCADE)
+
+
+class ModelEleven(models.Model):
+    twin = models.OneToOneField(
+        'self', null=True, related_name='+', on_delete=models.CASCADE)
+
+
+class ModelTwelve(models.Model):
+    members = models.ManyToManyField(ModelOne, through='ModelThirteen')
+
+
+class ModelThirteen(models.Model):
+    model_twelve = models.ForeignKey(ModelTwelve, on_delete=models.CASCADE)
+    model_one = models.ForeignKey(ModelOne, on_delete=models.CASCADE)
+    char_field = models.CharField(max_length=20, unique=True)
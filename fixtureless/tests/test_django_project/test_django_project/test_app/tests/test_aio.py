@@ -0,0 +1,66 @@
+from decimal import Decimal
+from unittest import skipUnless
+
+from django.test import TestCase
+
+from fixtureless.constants import PY3
+from test_app.models import ModelOne, ModelTwo, ModelSeven, ModelEleven
+
+if PY3:
+    import asyncio
+
+    from fixtureless.aio import abuild, acreate, acreate_model_instance
+
+
+def _run(coroutine_func, *args, **kwargs):
+    """
+    Drive a coroutine from a synchronous test the way Django does, so that
+    ``sync_to_async`` calls stay on the thread holding the test transaction.
+    """
+    try:
+        from asgiref.sync import async_to_sync
+    except ImportError:
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine_func(*args, **kwargs))
+        finally:
+            loop.close()
+    return async_to_sync(coroutine_func)(*args, **kwargs)
+
+
+@skipUnless(PY3, 'The async API requires Python 3')
+class AsyncFactoryTest(TestCase):
+    def test_acreate_model_instance(self):
+        model_two = _run(acreate_model_instance, ModelTwo)
+        self.assertIsInstance(model_two, ModelTwo)
+        self.assertIsNone(ModelTwo.objects.filter(pk=model_two.pk).first())
+        self.assertIsNotNone(model_two.foreign_key.pk)
+        self.assertIsNotNone(model_two.one_to_one.pk)
+        self.assertNotEqual(model_two.foreign_key, model_two.one_to_one)
+
+    def test_acreate(self):
+        model = _run(acreate, ModelOne)
+        self.assertIsInstance(model, ModelOne)
+        self.assertEqual(ModelOne.objects.count(), 1)
+
+        initial = {'decimal_field': Decimal('10.00')}
+        models = _run(acreate, (ModelOne, [initial, initial]), (ModelTwo, ))
+        self.assertEqual(len(models), 3)
+        self.assertEqual(models[1].decimal_field, initial['decimal_field'])
+        self.assertIsInstance(models[2], ModelTwo)
+        self.assertEqual(ModelTwo.objects.count(), 1)
+
+        # ModelTwo's FK reuses the last ModelOne, its OneToOne makes one.
+        self.assertEqual(ModelOne.objects.count(), 4)
+
+    def test_abuild(self):
+        models = _run(abuild, ModelOne, 2)
+        self.assertEqual(len(models), 2)
+        self.assertEqual(ModelOne.objects.count(), 0)
+
+    def test_self_reference(self):
+        model_seven = _run(acreate, ModelSeven)
+        self.assertEqual(model_seven.parent_id, model_seven.pk)
+
+        models = _run(acreate, ModelEleven, 2)
+        self.assertEqual([model.twin for model in models], [None, None])
@@ -0,0 +1,57 @@
+from django.test import TestCase
+
+from fixtureless import bulk
+from fixtureless import ledger
+from fixtureless.factory import build, create
+from test_app.models import ModelEight, ModelNine, ModelTen, ModelTwo
+
+
+class InheritanceTest(TestCase):
+    def test_parent_pointer_is_not_generated(self):
+        model_nine = create(ModelNine)
+        self.assertEqual(ModelEight.objects.count(), 1)
+        self.assertEqual(model_nine.modeleight_ptr_id, model_nine.id)
+
+    def test_tables(self):
+        self.assertEqual(bulk.tables(ModelTen),
+                         [ModelEight, ModelNine, ModelTen])
+        self.assertEqual(bulk.tables(ModelTwo), [ModelTwo])
+
+    def test_insert(self):
+        models = build(ModelNine, 5)
+        with self.assertNumQueries(2):
+            bulk.insert(models)
+        self.assertEqual(ModelEight.objects.count(), 5)
+        for model in models:
+            self.assertFalse(model._state.adding)
+            saved = ModelNine.objects.get(pk=model.pk)
+            self.assertEqual(saved.char_field, model.char_field)
+            self.assertEqual(saved.integer_field, model.integer_field)
+
+    def test_insert_batches(self):
+        models = build(ModelTen, 5)
+        with self.assertNumQueries(6):
+            bulk.insert(models, batch_size=3)
+        self.assertEqual(ModelTen.objects.count(), 5)
+        self.assertEqual(ModelNine.objects.count(), 5)
+
+    def test_schedule(self):
+        models = create(ModelTen, 4, schedule=True)
+        self.assertEqual(ModelTen.objects.count(), 4)
+        self.assertEqual(ModelEight.objects.count(), 4)
+        self.assertEqual(
+            set(ModelTen.objects.values_list('char_field', flat=True)),
+            set(model.char_field for model in models))
+
+    def test_missing_pk(self):
+        model = build(ModelNine)
+        model.id = None
+        bulk.insert([model])
+        self.assertIsNotNone(model.pk)
+        self.assertEqual(ModelNine.objects.count(), 1)
+
+    def test_ledger(self):
+        with ledger.recording() as recorded:
+            create(ModelTen, 3, schedule=True)
+        recorded.teardown()
+        self.assertEqual(ModelEight.objects.count(), 0)
@@ -0,0 +1,103 @@
+import os
+import shutil
+import tempfile
+
+from django.db.models import Model
+from django.test import TestCase
+
+from fixtureless import pool
+from fixtureless.checkpoint import Seed
+from fixtureless.exceptions import InvalidArguments
+from fixtureless.generator import Generator
+from test_app.models import ModelOne, ModelTwo
+
+
+class Crash(Exception):
+    pass
+
+
+class CrashingStrategy(object):
+    """
+    Generates the usual values, but raises on call number ``crash_at``.
+    """
+    def __init__(self, crash_at=None):
+        self.crash_at = crash_at
+        self.calls = 0
+
+    def __call__(self, **kwargs):
+        self.calls += 1
+        if self.calls == self.crash_at:
+            raise Crash()
+        return Generator(Model).get_func(kwargs['field'])(**kwargs)
+
+
+def _rows():
+    return sorted(ModelOne.objects.values_list(
+        'pk', 'char_field', 'decimal_field', 'integer_field'))
+
+
+class SeedTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'seed.checkpoint')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _run(self, strategy):
+        seed = Seed(self.path, seed=7, batch_size=10)
+        seed.create(ModelOne, 25, strategies={'char_field': strategy})
+        seed.create(ModelTwo, 5)
+        return seed
+
+    def _reset(self):
+        ModelTwo.objects.all().delete()
+        ModelOne.objects.all().delete()
+        os.remove(self.path)
+
+    def test_resume(self):
+        self._run(CrashingStrategy())
+        expected = _rows()
+        self._reset()
+
+        with self.assertRaises(Crash):
+            self._run(CrashingStrategy(crash_at=15))
+        self.assertEqual(ModelOne.objects.count(), 10)
+        seed = self._run(CrashingStrategy())
+        self.assertEqual(_rows(), expected)
+        self.assertEqual(seed.rows, {'test_app.ModelOne': 25,
+                                     'test_app.ModelTwo': 5})
+
+    def test_committed_but_not_recorded(self):
+        original = Seed._save
+        saves = []
+
+        def _save(seed, done, pending=None):
+            saves.append(pending)
+            # Die after the second batch commits, before it is recorded.
+            if pending is None and len(saves) == 5:
+                raise Crash()
+            original(seed, done, pending)
+
+        Seed._save = _save
+        try:
+            with self.assertRaises(Crash):
+                self._run(CrashingStrategy())
+        finally:
+            Seed._save = original
+        self.assertEqual(ModelOne.objects.count(), 20)
+        self._run(CrashingStrategy())
+        # 25 requested and 5 one-to-one parents of the ModelTwos.
+        self.assertEqual(ModelOne.objects.count(), 30)
+        self.assertEqual(ModelTwo.objects.count(), 5)
+
+    def test_finished_run_is_skipped(self):
+        self._run(CrashingStrategy())
+        with self.assertNumQueries(0):
+            seed = Seed(self.path, seed=7, batch_size=10)
+            self.assertEqual(seed.create(ModelOne, 25), 0)
+
+    def test_pool(self):
+        with pool.enabled():
+            with self.assertRaises(InvalidArguments):
+                Seed(self.path).create(ModelOne, 1)
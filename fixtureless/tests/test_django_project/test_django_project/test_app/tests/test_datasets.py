@@ -0,0 +1,108 @@
+import json
+import os
+import shutil
+import tempfile
+
+from django.test import TestCase
+
+from fixtureless import distributions
+from fixtureless.datasets import Dataset, top_up
+from fixtureless.exceptions import InvalidArguments
+from fixtureless.factory import create
+from test_app.models import ModelOne, ModelTwo, ModelFive
+
+
+class DatasetTest(TestCase):
+    def setUp(self):
+        self.dataset = Dataset({
+            ModelOne: 1,
+            ModelTwo: {'ratio': 2, 'initial': {'char_field': 'two'}},
+            ModelFive: {'ratio': 0.5, 'strategies': {'foreign_key': 'zipf'}},
+        })
+
+    def test_counts(self):
+        self.assertEqual(self.dataset.counts(10),
+                         {ModelOne: 10, ModelTwo: 20, ModelFive: 5})
+
+    def test_strategies(self):
+        strategies = self.dataset.strategies(ModelTwo)
+        self.assertEqual(set(strategies), set(['foreign_key']))
+        self.assertIsInstance(strategies['foreign_key'], distributions.Uniform)
+        self.assertIsInstance(
+            self.dataset.strategies(ModelFive)['foreign_key'],
+            distributions.Zipf)
+
+    def test_create(self):
+        created = self.dataset.create(scale=4)
+        self.assertEqual(len(created[ModelTwo]), 8)
+        self.assertEqual(len(created[ModelFive]), 2)
+        self.assertEqual(ModelTwo.objects.filter(char_field='two').count(), 8)
+        self.assertEqual(ModelFive.objects.count(), 2)
+        # The one-to-one parents of the ModelTwos are ModelOnes as well.
+        self.assertEqual(ModelOne.objects.count(), 12)
+        parents = set(ModelTwo.objects.values_list('foreign_key', flat=True))
+        self.assertTrue(parents.issubset(
+            set(obj.pk for obj in created[ModelOne])))
+
+    def test_load(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'dataset.json')
+            with open(path, 'w') as f:
+                json.dump({'test_app.ModelOne': 1,
+                           'test_app.ModelTwo': {'ratio': 3}}, f)
+            dataset = Dataset.load(path)
+        finally:
+            shutil.rmtree(directory)
+        self.assertEqual(dataset.counts(2), {ModelOne: 2, ModelTwo: 6})
+
+    def test_invalid(self):
+        with self.assertRaises(InvalidArguments):
+            Dataset({'test_app.Unknown': 1})
+        with self.assertRaises(InvalidArguments):
+            Dataset({ModelTwo: {'ratio': 1, 'strategies': {
+                'char_field': 'unknown'}}}).strategies(ModelTwo)
+
+
+class TopUpTest(TestCase):
+    def test_top_up(self):
+        create(ModelOne, 3)
+        created = top_up({ModelOne: 5})
+        self.assertEqual(len(created[ModelOne]), 2)
+        self.assertEqual(ModelOne.objects.count(), 5)
+
+    def test_parents_count(self):
+        # The ModelFives need a ModelTwo, which needs a one-to-one ModelOne.
+        top_up({ModelOne: 5, ModelFive: 2})
+        self.assertEqual(ModelOne.objects.count(), 6)
+        self.assertEqual(ModelFive.objects.count(), 2)
+
+    def test_unique_parents_count(self):
+        # Each ModelTwo creates its one-to-one ModelOne.
+        created = Dataset({ModelOne: 1, ModelTwo: 1}).top_up(scale=5)
+        self.assertNotIn(ModelOne, created)
+        self.assertEqual(ModelOne.objects.count(), 5)
+        self.assertEqual(ModelTwo.objects.count(), 5)
+
+    def test_all_rows(self):
+        strategies = Dataset({ModelOne: 1, ModelTwo: 1}).strategies(
+            ModelTwo, limit=None)
+        self.assertIsNone(strategies['foreign_key'].limit)
+
+    def test_idempotent(self):
+        targets = {'test_app.ModelOne': 4, 'test_app.ModelTwo': 2}
+        top_up(targets)
+        counts = (ModelOne.objects.count(), ModelTwo.objects.count())
+        with self.assertNumQueries(2):
+            self.assertEqual(top_up(targets), {})
+        self.assertEqual(
+            (ModelOne.objects.count(), ModelTwo.objects.count()), counts)
+
+    def test_existing_parents(self):
+        parents = create(ModelOne, 3)
+        Dataset({ModelOne: 1, ModelTwo: 10}).top_up(scale=3)
+        self.assertEqual(ModelTwo.objects.count(), 30)
+        used = set(ModelTwo.objects.values_list('foreign_key', flat=True))
+        self.assertTrue(used.issubset(
+            set(ModelOne.objects.values_list('pk', flat=True))))
+        self.assertTrue(used.intersection(obj.pk for obj in parents))
@@ -0,0 +1,66 @@
+import collections
+
+from django.test import TestCase
+
+from fixtureless import distributions
+from fixtureless.exceptions import InvalidArguments
+from fixtureless.factory import create
+from test_app.models import ModelOne, ModelTwo
+
+
+class DistributionsTest(TestCase):
+    def setUp(self):
+        self.parents = sorted(create(ModelOne, 4), key=lambda obj: obj.pk)
+        self.pks = [parent.pk for parent in self.parents]
+
+    def _counts(self, distribution, count=40, **kwargs):
+        strategies = {'foreign_key': distribution}
+        models = create(ModelTwo, count, strategies=strategies, **kwargs)
+        return collections.Counter(
+            model_two.foreign_key_id for model_two in models)
+
+    def test_uniform(self):
+        counts = self._counts(distributions.Uniform())
+        self.assertTrue(set(counts).issubset(self.pks))
+        self.assertGreater(len(counts), 1)
+
+    def test_sequential(self):
+        counts = self._counts(distributions.Sequential())
+        self.assertEqual(counts, dict((pk, 10) for pk in self.pks))
+
+    def test_weighted(self):
+        counts = self._counts(distributions.Weighted([0, 1]))
+        self.assertEqual(counts, {self.pks[1]: 40})
+        weights = {self.pks[2]: 1, self.pks[3]: 0}
+        counts = self._counts(distributions.Weighted(weights))
+        self.assertEqual(counts, {self.pks[2]: 40})
+
+    def test_zero_weights(self):
+        with self.assertRaises(InvalidArguments):
+            distributions.Weighted([0, 0])
+        with self.assertRaises(InvalidArguments):
+            distributions.Weighted({self.pks[0]: -1, self.pks[1]: 2})
+        # Only the first 4 parents exist
+        with self.assertRaises(InvalidArguments):
+            self._counts(distributions.Weighted([0] * 4 + [1]))
+
+    def test_zipf(self):
+        counts = self._counts(distributions.Zipf(3), count=200)
+        self.assertEqual(counts.most_common(1)[0][0], self.pks[0])
+
+    def test_scheduled(self):
+        weights = dict((pk, 1) for pk in self.pks)
+        counts = self._counts(distributions.Weighted(weights), schedule=True)
+        self.assertTrue(set(counts).issubset(self.pks))
+        self.assertEqual(sum(counts.values()), 40)
+
+    def test_saved(self):
+        self._counts(distributions.Sequential(), count=4)
+        self.assertEqual(
+            set(ModelTwo.objects.values_list('foreign_key', flat=True)),
+            set(self.pks))
+
+    def test_unique(self):
+        with self.assertRaises(InvalidArguments):
+            create(ModelTwo, strategies={
+                'one_to_one': distributions.Uniform()})
@@ -0,0 +1,79 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+
+from fixtureless.factory import create
+from fixtureless.fastload import fast_load
+from test_app.models import ModelOne, ModelTwo
+
+
+def _pragma(name):
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA {}'.format(name))
+        return cursor.fetchone()[0]
+
+
+class Boom(Exception):
+    pass
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Tunes SQLite pragmas')
+class SQLiteFastLoadTest(TestCase):
+    def test_pragmas(self):
+        cache_size = _pragma('cache_size')
+        with fast_load():
+            self.assertEqual(_pragma('cache_size'), -200000)
+            create(ModelTwo, 3)
+        self.assertEqual(_pragma('cache_size'), cache_size)
+        self.assertEqual(ModelTwo.objects.count(), 3)
+
+    def test_restored_on_failure(self):
+        cache_size = _pragma('cache_size')
+        with self.assertRaises(Boom):
+            with fast_load():
+                create(ModelOne)
+                raise Boom()
+        self.assertEqual(_pragma('cache_size'), cache_size)
+        self.assertEqual(ModelOne.objects.count(), 0)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Tunes SQLite pragmas')
+class SQLiteFastLoadPipelineTest(TransactionTestCase):
+    def test_outside_transactions(self):
+        synchronous = _pragma('synchronous')
+        with fast_load():
+            self.assertEqual(_pragma('synchronous'), 0)
+            self.assertEqual(_pragma('journal_mode'), 'memory')
+            create(ModelOne, 5, pipeline=True, batch_size=2)
+        self.assertEqual(_pragma('synchronous'), synchronous)
+        self.assertEqual(ModelOne.objects.count(), 5)
+
+
+@skipUnless(connection.vendor == 'postgresql', 'Drops PostgreSQL indexes')
+class PostgresFastLoadTest(TestCase):
+    def _indexes(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT indexname FROM pg_indexes WHERE tablename = %s',
+                [ModelTwo._meta.db_table])
+            return set(row[0] for row in cursor.fetchall())
+
+    def _constraints(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT conname FROM pg_constraint WHERE contype = 'f'"
+                ' AND conrelid = %s::regclass', [ModelTwo._meta.db_table])
+            return set(row[0] for row in cursor.fetchall())
+
+    def test_indexes_and_constraints(self):
+        indexes = self._indexes()
+        constraints = self._constraints()
+        with self.assertRaises(Boom):
+            with fast_load([ModelTwo]):
+                self.assertFalse(self._constraints())
+                self.assertLess(len(self._indexes()), len(indexes))
+                create(ModelTwo, 3)
+                raise Boom()
+        self.assertEqual(self._indexes(), indexes)
+        self.assertEqual(self._constraints(), constraints)
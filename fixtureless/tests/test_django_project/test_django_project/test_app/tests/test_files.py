@@ -0,0 +1,56 @@
+from django.core.files.base import ContentFile
+from django.core.files.images import get_image_dimensions
+from django.test import TestCase
+
+from fixtureless import files
+from fixtureless.factory import create
+from test_app.models import ModelOne
+
+
+class MemoryStorageTest(TestCase):
+    def test_storage(self):
+        storage = files.MemoryStorage(base_url='/media/')
+        first = storage.save('a/one.txt', ContentFile(b'same'))
+        second = storage.save('two.txt', ContentFile(u'same'))
+        self.assertEqual(len(storage.blobs), 1)
+        self.assertEqual(storage.open(first).read(), b'same')
+        self.assertEqual(storage.size(second), 4)
+        self.assertEqual(storage.url(first), '/media/a/one.txt')
+        self.assertEqual(storage.listdir(''), (['a'], ['two.txt']))
+        self.assertEqual(storage.listdir('a'), ([], ['one.txt']))
+
+        storage.delete(first)
+        self.assertFalse(storage.exists(first))
+        self.assertEqual(len(storage.blobs), 1)
+        storage.delete(second)
+        self.assertEqual(storage.blobs, {})
+        with self.assertRaises(IOError):
+            storage.open(first)
+
+    def test_png(self):
+        data = files.png(3, 2, (255, 0, 0))
+        self.assertEqual(get_image_dimensions(ContentFile(data)), (3, 2))
+
+
+class InMemoryFilesTest(TestCase):
+    def test_enabled(self):
+        storage_before = ModelOne._meta.get_field('file_field').storage
+        with files.enabled(image_size=(5, 4)) as storage:
+            models = create(ModelOne, 20)
+            self.assertLessEqual(len(storage.blobs), 16)
+            model = ModelOne.objects.get(pk=models[0].pk)
+            self.assertEqual((model.image_width, model.image_height), (5, 4))
+            self.assertEqual(model.image_field.width, 5)
+            self.assertEqual(model.file_field.read()[:16],
+                             b'fixtureless file')
+            model.refresh_from_db()
+        self.assertIs(ModelOne._meta.get_field('file_field').storage,
+                      storage_before)
+        self.assertIsNone(files.get_storage())
+
+    def test_shared(self):
+        with files.enabled() as storage:
+            models = create(ModelOne, 30, schedule=True)
+        names = set(model.file_field.name for model in models)
+        self.assertLessEqual(len(names), 8)
+        self.assertEqual(len(storage.names), len(storage.blobs))
@@ -0,0 +1,55 @@
+import datetime
+
+from django.http import QueryDict
+from django.test import TestCase
+
+from fixtureless import formdata
+from fixtureless.factory import create_form
+from test_app.forms import FormOne
+
+
+class FormDataTest(TestCase):
+    def test_payloads(self):
+        payloads = list(formdata.payloads(FormOne, 20))
+        self.assertEqual(len(payloads), 20)
+        for data in payloads:
+            form = FormOne(data)
+            self.assertTrue(form.is_valid(), form.errors)
+            self.assertTrue(all(isinstance(val, str)
+                                for val in data.values()))
+
+    def test_initial(self):
+        data = next(formdata.payloads(FormOne, 1, {'char_field': 'pinned',
+                                                   'boolean_field': True}))
+        self.assertEqual(data['char_field'], 'pinned')
+        self.assertEqual(data['boolean_field'], 'on')
+
+    def test_encode(self):
+        body = next(formdata.payloads(FormOne, 1, encode=True))
+        form = FormOne(QueryDict(body))
+        self.assertTrue(form.is_valid(), form.errors)
+
+    def test_endless(self):
+        stream = formdata.payloads(FormOne)
+        self.assertEqual(len([next(stream) for _ in range(50)]), 50)
+
+    def test_plan(self):
+        self.assertIs(formdata.get_plan(FormOne), formdata.get_plan(FormOne))
+        plan = formdata.FormPlan(FormOne, prefix='one')
+        self.assertIn('one-char_field', plan.payload())
+
+    def test_strategies(self):
+        strategies = {'integer_field': lambda **kwargs: 7}
+        data = next(formdata.payloads(FormOne, 1, strategies=strategies))
+        self.assertEqual(data['integer_field'], '7')
+
+    def test_to_data(self):
+        self.assertIsNone(formdata.to_data(False))
+        self.assertEqual(formdata.to_data([1, 2]), ['1', '2'])
+        self.assertEqual(
+            formdata.to_data(datetime.datetime(2020, 1, 2, 3, 4, 5)),
+            '2020-01-02 03:04:05')
+
+    def test_create_form(self):
+        form = create_form(FormOne)
+        self.assertTrue(form.is_valid())
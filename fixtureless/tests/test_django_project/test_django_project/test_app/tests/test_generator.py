@@ -1,16 +1,63 @@
 import datetime
+import itertools
+import random
 from decimal import Decimal
 
 from django.test import TestCase
+from django.db.models import Model
 from django.db.models.fields.files import FieldFile, ImageFieldFile
 from django.utils import six
 
-from test_app.models import ModelOne, ModelTwo, ModelThree
+from test_app.models import ModelOne, ModelTwo, ModelThree, ModelEleven
 from test_app.forms import FormOne
-from fixtureless.generator import create_model_instance, create_form_instance
+from fixtureless.generator import (
+    Generator, create_model_instance, create_form_instance)
 from fixtureless.constants import POSTGRES_SMALLINT_MAX, POSTGRES_INT_MAX, PY3, POSTGRES_BIGINT_MAX
 
 
+class GeneratorTest(TestCase):
+    def test_unique_vals_are_not_reissued(self):
+        class TinyGenerator(Generator):
+            def _generate_autofield(self, **kwargs):
+                return random.choice([1, 2])
+
+        gen = TinyGenerator(Model)
+        field = ModelOne._meta.get_field('auto_field')
+        vals = set(gen.get_val(instance=ModelOne(), field=field)
+                   for _ in range(2))
+        self.assertEqual(vals, set([1, 2]))
+
+    def test_get_vals(self):
+        class TinyGenerator(Generator):
+            def _generate_autofield(self, **kwargs):
+                return random.choice([1, 2, 3])
+
+        create_model_instance(ModelOne, auto_field=1).save()
+        gen = TinyGenerator(Model)
+        field = ModelOne._meta.get_field('auto_field')
+        vals = gen.get_vals(field, [ModelOne(), ModelOne()])
+        self.assertEqual(sorted(vals), [2, 3])
+
+    def test_get_vals_batches(self):
+        counter = itertools.count(1)
+
+        class CountingGenerator(Generator):
+            def _generate_autofield(self, **kwargs):
+                return next(counter)
+
+        ModelEleven.objects.bulk_create(
+            [ModelEleven(id=i) for i in range(1, 401)])
+        gen = CountingGenerator(Model)
+        field = ModelEleven._meta.get_field('id')
+        vals = gen.get_vals(field, [ModelEleven() for _ in range(700)])
+        self.assertEqual(sorted(vals), list(range(401, 1101)))
+
+    def test_get_vals_null(self):
+        field = ModelEleven._meta.get_field('twin')
+        vals = Generator(Model).get_vals(field, [ModelEleven(), ModelEleven()])
+        self.assertEqual(vals, [None, None])
+
+
 class ModelOneTest(TestCase):
     def setUp(self):
         self.model_one = create_model_instance(ModelOne)
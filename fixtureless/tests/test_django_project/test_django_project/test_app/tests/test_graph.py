@@ -0,0 +1,51 @@
+from django.test import TestCase
+
+from fixtureless import graph
+from fixtureless.exceptions import InvalidArguments
+from fixtureless.factory import build, create
+from test_app.models import ModelOne, ModelTwo, ModelFive
+
+
+class GraphTest(TestCase):
+    def test_children(self):
+        models = create(ModelOne, 3, children={'modeltwo_fk': 4})
+        for model_one in models:
+            self.assertEqual(model_one.modeltwo_fk.count(), 4)
+        self.assertEqual(ModelTwo.objects.count(), 12)
+
+    def test_nested(self):
+        model_one = create(ModelOne, children={'modeltwo_fk': {
+            'count': 2, 'initial': {'char_field': 'child'},
+            'children': {'modelfive_fk': (1, 3)}}})
+        model_twos = model_one.modeltwo_fk.all()
+        self.assertEqual(len(model_twos), 2)
+        for model_two in model_twos:
+            self.assertEqual(model_two.char_field, 'child')
+            self.assertIn(model_two.modelfive_fk.count(), (1, 2, 3))
+
+    def test_queries_per_level(self):
+        parents = create(ModelOne, 10)
+        # One pk check and one insert for each of: the ModelTwos' one-to-one
+        # parents, the ModelTwos and the ModelFives.
+        with self.assertNumQueries(6):
+            created = graph.populate(parents, {'modeltwo_fk': {
+                'count': 5, 'children': {'modelfive_fk': 2}}})
+        self.assertEqual(len(created['modeltwo_fk']), 50)
+        self.assertEqual(ModelFive.objects.count(), 100)
+
+    def test_one_to_one(self):
+        models = create(ModelOne, 2, children={'modeltwo_one2one': 1})
+        for model_one in models:
+            self.assertIsInstance(model_one.modeltwo_one2one, ModelTwo)
+
+    def test_invalid(self):
+        with self.assertRaises(InvalidArguments):
+            create(ModelOne, children={'unknown': 2})
+        with self.assertRaises(InvalidArguments):
+            create(ModelOne, children={'modeltwo_fk': {
+                'children': {'unknown': 1}}})
+        with self.assertRaises(InvalidArguments):
+            create(ModelOne, children={'modeltwo_one2one': 2})
+        with self.assertRaises(InvalidArguments):
+            build(ModelOne, children={'modeltwo_fk': 2})
+        self.assertEqual(ModelOne.objects.count(), 0)
@@ -0,0 +1,87 @@
+from decimal import Decimal
+
+from django.core import serializers
+from django.test import TestCase
+from django.utils import six
+
+from fixtureless import lazy
+from fixtureless.factory import build, build_form
+from fixtureless.generator import create_model_instance
+from test_app.forms import FormOne
+from test_app.models import ModelOne, ModelTwo
+
+
+class LazyModelInstanceTest(TestCase):
+    def test_fields_generated_on_access(self):
+        model_one = lazy.create_model_instance(ModelOne)
+        self.assertTrue(lazy.is_pending(model_one, 'char_field'))
+        self.assertNotIn('char_field', model_one.__dict__)
+
+        char_field = model_one.char_field
+        self.assertIsInstance(char_field, six.string_types)
+        self.assertFalse(lazy.is_pending(model_one, 'char_field'))
+        self.assertEqual(model_one.char_field, char_field)
+        self.assertTrue(lazy.is_pending(model_one, 'text_field'))
+
+    def test_initial_is_not_lazy(self):
+        model_one = lazy.create_model_instance(
+            ModelOne, decimal_field=Decimal('10.00'))
+        self.assertFalse(lazy.is_pending(model_one, 'decimal_field'))
+        self.assertEqual(model_one.decimal_field, Decimal('10.00'))
+
+    def test_no_queries_until_read(self):
+        with self.assertNumQueries(0):
+            model_two = lazy.create_model_instance(ModelTwo)
+            model_two.char_field
+        self.assertTrue(lazy.is_pending(model_two, 'foreign_key'))
+
+    def test_foreign_key_generated_on_access(self):
+        model_two = lazy.create_model_instance(ModelTwo)
+        self.assertIsInstance(model_two.foreign_key, ModelOne)
+        self.assertIsNotNone(model_two.foreign_key.pk)
+
+    def test_pk_forces_everything(self):
+        model_one = lazy.create_model_instance(ModelOne)
+        other = lazy.create_model_instance(ModelOne)
+        self.assertNotEqual(model_one, other)
+        for name in ('char_field', 'decimal_field', 'datetime_field'):
+            self.assertFalse(lazy.is_pending(model_one, name))
+            self.assertFalse(lazy.is_pending(other, name))
+
+    def test_force(self):
+        model_one = lazy.create_model_instance(ModelOne)
+        lazy.force(model_one)
+        for field in ModelOne._meta.fields:
+            self.assertFalse(lazy.is_pending(model_one, field.name))
+
+    def test_save(self):
+        model_two = lazy.create_model_instance(ModelTwo)
+        model_two.save()
+        saved = ModelTwo.objects.get(pk=model_two.pk)
+        self.assertEqual(saved.char_field, model_two.char_field)
+        self.assertEqual(saved.foreign_key, model_two.foreign_key)
+
+    def test_serialize(self):
+        model_one = lazy.create_model_instance(ModelOne)
+        data = serializers.serialize('python', [model_one])
+        self.assertEqual(data[0]['fields']['char_field'], model_one.char_field)
+
+    def test_eager_instances_unaffected(self):
+        lazy.create_model_instance(ModelOne)
+        model_one = create_model_instance(ModelOne)
+        self.assertIn('char_field', model_one.__dict__)
+        model_one.save()
+
+        model_one = ModelOne.objects.defer('char_field').get(pk=model_one.pk)
+        self.assertNotIn('char_field', model_one.__dict__)
+        self.assertEqual(
+            model_one.char_field,
+            ModelOne.objects.get(pk=model_one.pk).char_field)
+
+    def test_factory_build(self):
+        models = build(ModelOne, 2, lazy=True)
+        self.assertEqual(len(models), 2)
+        self.assertTrue(lazy.is_pending(models[0], 'char_field'))
+
+        with self.assertRaises(NotImplementedError):
+            build_form(FormOne, lazy=True)
@@ -0,0 +1,106 @@
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from fixtureless import ledger
+from fixtureless.factory import create
+from fixtureless.generator import create_model_instance
+from test_app.models import (
+    ModelOne, ModelTwo, ModelFour, ModelFive, ModelTen, ModelThirteen)
+
+
+class LedgerTest(TestCase):
+    def test_records_parents(self):
+        with ledger.recording() as recorded:
+            model_two = create(ModelTwo)
+        self.assertEqual(recorded.pks(ModelTwo), [model_two.pk])
+        self.assertEqual(
+            set(recorded.pks(ModelOne)),
+            set([model_two.foreign_key_id, model_two.one_to_one_id]))
+        self.assertEqual(recorded.pks(ModelOne, using='default'),
+                         recorded.pks(ModelOne))
+
+    def test_records_bulk_paths(self):
+        with ledger.recording() as recorded:
+            create((ModelOne, 2), (ModelTwo, 2), schedule=True)
+            create(ModelOne, children={'modeltwo_fk': 2})
+        self.assertEqual(len(recorded.pks(ModelOne)), 2 + 2 + 1 + 2)
+        self.assertEqual(len(recorded.pks(ModelTwo)), 4)
+
+    def test_not_recording(self):
+        with ledger.recording() as recorded:
+            pass
+        create(ModelOne)
+        self.assertEqual(recorded.pks(ModelOne), [])
+
+    def test_teardown(self):
+        existing = create(ModelOne)
+        with ledger.recording() as recorded:
+            create(ModelFive, 3)
+            create(ModelFour, 2, m2m={'many_to_many': 2, 'symmetrical': 1})
+        recorded.teardown(chunk_size=2)
+        self.assertEqual(list(ModelOne.objects.all()), [existing])
+        for model in (ModelTwo, ModelFour, ModelFive,
+                      ModelFour.many_to_many.through,
+                      ModelFour.symmetrical.through):
+            self.assertEqual(model.objects.count(), 0)
+        self.assertEqual(recorded.pks(ModelOne), [])
+
+    def test_truncate(self):
+        with ledger.recording() as recorded:
+            create(ModelTwo, 2)
+        with CaptureQueriesContext(connection) as queries:
+            recorded.teardown()
+        tables = [query['sql'] for query in queries
+                  if query['sql'].startswith(('DELETE', 'TRUNCATE'))
+                  and 'WHERE' not in query['sql']]
+        self.assertEqual(len(tables), 1 if 'TRUNCATE' in tables[0] else 2)
+        self.assertEqual(ModelOne.objects.count(), 0)
+
+    def test_postgresql_truncatable(self):
+        class Connection(object):
+            vendor = 'postgresql'
+            alias = 'default'
+
+        with ledger.recording() as recorded:
+            model_five = create(ModelFive)
+        rows = dict((model, recorded.pks(model))
+                    for model in (ModelOne, ModelTwo, ModelFive))
+        self.assertEqual(
+            ledger._truncatable(Connection(), rows),
+            set([ModelOne, ModelTwo, ModelFive, ModelTen, ModelThirteen,
+                 ModelFour.many_to_many.through]))
+
+        # A row from outside the ledger keeps the tables it references
+        create(ModelFive, {'foreign_key': model_five.foreign_key})
+        self.assertEqual(
+            ledger._truncatable(Connection(), rows),
+            set([ModelThirteen, ModelFour.many_to_many.through]))
+
+    def test_chunks(self):
+        create_model_instance(ModelOne).save()
+        with ledger.recording() as recorded:
+            create(ModelOne, 5)
+        with CaptureQueriesContext(connection) as queries:
+            recorded.teardown(chunk_size=2)
+        deletes = [query for query in queries if query['sql'].startswith(
+            'DELETE FROM "test_app_modelone"')]
+        self.assertEqual(len(deletes), 3)
+        self.assertEqual(ModelOne.objects.count(), 1)
+
+
+class LedgerTeardownMixinTest(ledger.LedgerTeardownMixin,
+                              TransactionTestCase):
+    def test_create(self):
+        create(ModelTwo, 3)
+        self.assertEqual(ModelTwo.objects.count(), 3)
+
+    def test_isolated(self):
+        self.assertEqual(ModelTwo.objects.count(), 0)
+        create(ModelTwo, 3)
+
+    def test_nothing_recorded(self):
+        create_model_instance(ModelOne).save()
+
+    def test_nothing_recorded_flushed(self):
+        self.assertEqual(ModelOne.objects.count(), 0)
@@ -0,0 +1,73 @@
+from django.conf.urls import url
+from django.http import HttpResponse, HttpResponseBadRequest
+from django.test import SimpleTestCase, override_settings
+
+from fixtureless import exceptions
+from fixtureless.loadtest import LoadDriver, Target, TargetStats
+from test_app.forms import FormOne
+
+
+def form_view(request):
+    form = FormOne(request.POST)
+    if not form.is_valid():
+        return HttpResponseBadRequest()
+    return HttpResponse('ok')
+
+
+def failing_view(request):
+    raise ValueError('failing')
+
+
+urlpatterns = [url(r'^form/$', form_view)]
+
+
+@override_settings(ROOT_URLCONF='test_app.tests.test_loadtest')
+class LoadDriverTest(SimpleTestCase):
+    def test_client(self):
+        report = LoadDriver([Target('form', FormOne, path='/form/')],
+                            requests=20, concurrency=3).run()
+        stats = report['form']
+        self.assertEqual(stats.count, 20)
+        self.assertEqual(stats.errors, 0)
+        self.assertGreater(stats.throughput, 0)
+        self.assertLessEqual(stats.percentile(50), stats.percentile(99))
+        self.assertIn('p99 ms', str(report))
+
+    def test_view(self):
+        report = LoadDriver([
+            Target('form', FormOne, view=form_view, weight=3),
+            Target('invalid', FormOne, view=form_view,
+                   initial={'integer_field': 'x'}),
+            Target('failing', view=failing_view, weight=0),
+        ], requests=40).run()
+        self.assertEqual(report.count, 40)
+        self.assertEqual(report['form'].errors, 0)
+        self.assertEqual(report['invalid'].errors, report['invalid'].count)
+        self.assertEqual(report['failing'].count, 0)
+
+    def test_errors(self):
+        report = LoadDriver([Target('failing', view=failing_view)],
+                            requests=3).run()
+        self.assertEqual(report['failing'].errors, 3)
+
+    def test_rate(self):
+        report = LoadDriver([Target('form', FormOne, view=form_view)],
+                            requests=10, concurrency=2, rate=200).run()
+        self.assertGreaterEqual(report.elapsed, 9 / 200.0)
+        self.assertLessEqual(report.throughput, 200 * 1.1)
+
+    def test_percentile(self):
+        stats = TargetStats('view', 1.0)
+        stats.latencies = [float(latency) for latency in range(1, 101)]
+        self.assertEqual(stats.percentile(50), 50)
+        self.assertEqual(stats.percentile(99), 99)
+        self.assertEqual(stats.percentile(100), 100)
+        self.assertEqual(stats.throughput, 100)
+
+    def test_invalid(self):
+        with self.assertRaises(exceptions.InvalidArguments):
+            Target('nowhere', FormOne)
+        with self.assertRaises(exceptions.InvalidArguments):
+            LoadDriver([])
+        with self.assertRaises(exceptions.InvalidArguments):
+            LoadDriver([Target('idle', view=lambda request: None, weight=0)])
@@ -0,0 +1,74 @@
+from django.test import TestCase
+
+from fixtureless import m2m
+from fixtureless.exceptions import InvalidArguments
+from fixtureless.factory import build, create
+from test_app.models import (
+    ModelOne, ModelFour, ModelTwelve, ModelThirteen)
+
+
+class M2MTest(TestCase):
+    def test_fixed_fan_out(self):
+        models = create(ModelFour, 3, m2m={'many_to_many': 2})
+        for model_four in models:
+            self.assertEqual(model_four.many_to_many.count(), 2)
+        self.assertEqual(ModelOne.objects.count(), 2)
+
+    def test_range_fan_out(self):
+        models = create(ModelFour, 5, m2m={'many_to_many': (1, 3)})
+        for model_four in models:
+            self.assertIn(model_four.many_to_many.count(), (1, 2, 3))
+
+    def test_callable_fan_out(self):
+        model_four = create(ModelFour, m2m={'many_to_many': lambda: 4})
+        self.assertEqual(model_four.many_to_many.count(), 4)
+
+    def test_reuses_existing_targets(self):
+        create(ModelOne, 3)
+        create(ModelFour, 2, m2m={'many_to_many': 3})
+        self.assertEqual(ModelOne.objects.count(), 3)
+
+    def test_one_insert_per_relation(self):
+        models = create(ModelFour, 4)
+        create(ModelOne, 2)
+        # One query for the existing targets and one insert.
+        with self.assertNumQueries(2):
+            m2m.populate(models, {'many_to_many': 2})
+        through = ModelFour.many_to_many.through
+        self.assertEqual(through.objects.count(), 8)
+
+    def test_custom_through(self):
+        models = create(ModelTwelve, 30)
+        create(ModelOne, 3)
+        # The existing targets, a check per unique column and the insert.
+        with self.assertNumQueries(4):
+            m2m.populate(models, {'members': 3})
+        self.assertEqual(ModelThirteen.objects.count(), 90)
+        self.assertEqual(models[0].members.count(), 3)
+        self.assertEqual(
+            len(set(ModelThirteen.objects.values_list(
+                'char_field', flat=True))), 90)
+
+    def test_symmetrical(self):
+        models = create(ModelFour, 4, m2m={'symmetrical': 2})
+        through = ModelFour.symmetrical.through
+        for model_four in models:
+            self.assertGreaterEqual(model_four.symmetrical.count(), 2)
+            self.assertNotIn(model_four, model_four.symmetrical.all())
+            for other in model_four.symmetrical.all():
+                self.assertIn(model_four, other.symmetrical.all())
+        self.assertEqual(through.objects.count() % 2, 0)
+
+    def test_scheduled(self):
+        models = create((ModelOne, 2), (ModelFour, 2), schedule=True,
+                        m2m={'many_to_many': 2})
+        self.assertEqual(models[2].many_to_many.count(), 2)
+
+    def test_invalid(self):
+        with self.assertRaises(InvalidArguments):
+            create(ModelOne, m2m={'many_to_many': 2})
+        with self.assertRaises(InvalidArguments):
+            create(ModelFour, m2m={'char_field': 2})
+        with self.assertRaises(InvalidArguments):
+            build(ModelFour, m2m={'many_to_many': 2})
+        self.assertEqual(ModelFour.objects.count(), 0)
@@ -0,0 +1,39 @@
+import json
+
+from django.test import TestCase
+
+from fixtureless import payloads
+from fixtureless.factory import build, create
+from test_app.models import ModelOne, ModelThree
+
+
+class PayloadsTest(TestCase):
+    def test_text(self):
+        for size in (0, 1, 1000, 1024, 100000):
+            self.assertEqual(len(payloads.text(size)), size)
+
+    def test_text_varies(self):
+        self.assertNotEqual(payloads.text(4096), payloads.text(4096))
+
+    def test_document(self):
+        doc = payloads.document(4096, depth=3, width=2)
+        self.assertEqual(set(doc), set(['k0', 'k1']))
+        self.assertIsInstance(doc['k0']['k1']['k0'], str)
+        self.assertAlmostEqual(len(json.dumps(doc)), 4096, delta=8)
+
+    def test_text_strategy(self):
+        models = create(ModelOne, 3, strategies={
+            'text_field': payloads.Text((5000, 6000)),
+            'char_field': payloads.Text(100000)})
+        rows = ModelOne.objects.filter(pk__in=[obj.pk for obj in models])
+        for text_field, char_field in rows.values_list(
+                'text_field', 'char_field'):
+            self.assertTrue(5000 <= len(text_field) <= 6000)
+            self.assertEqual(len(char_field), 255)
+
+    def test_json_strategy(self):
+        model_three = build(ModelThree, strategies={
+            'json_field': payloads.JSON(lambda: 1000, depth=1, width=10)})
+        self.assertEqual(len(model_three.json_field), 10)
+        self.assertAlmostEqual(
+            len(json.dumps(model_three.json_field)), 1000, delta=10)
@@ -0,0 +1,61 @@
+from django.db import IntegrityError
+from django.test import TestCase, TransactionTestCase
+
+from fixtureless.exceptions import InvalidArguments
+from fixtureless.factory import create, create_form
+from fixtureless.generator import create_model_instance
+from fixtureless.pipeline import Pipeline
+from test_app.forms import FormOne
+from test_app.models import ModelOne, ModelTwo
+
+
+class PipelineTest(TransactionTestCase):
+    def test_save_instances(self):
+        instances = (create_model_instance(ModelOne) for _ in range(7))
+        saved = Pipeline(batch_size=3).save_instances(instances)
+        self.assertEqual(len(saved), 7)
+        self.assertEqual(ModelOne.objects.count(), 7)
+        self.assertEqual(
+            set(ModelOne.objects.values_list('pk', flat=True)),
+            set(instance.pk for instance in saved))
+
+    def test_consumer_error_is_raised(self):
+        model_one = create_model_instance(ModelOne)
+        model_one.save()
+        duplicate = create_model_instance(ModelOne, auto_field=model_one.pk)
+        instances = [create_model_instance(ModelOne), duplicate]
+        with self.assertRaises(IntegrityError):
+            Pipeline(batch_size=1).save_instances(instances)
+
+    def test_create(self):
+        models = create(ModelOne, 5, pipeline=True, batch_size=2)
+        self.assertEqual(len(models), 5)
+        self.assertEqual(ModelOne.objects.count(), 5)
+
+        models = create((ModelOne, 2), (ModelTwo, 2), pipeline=True)
+        self.assertIsInstance(models[0], ModelOne)
+        self.assertIsInstance(models[3], ModelTwo)
+        self.assertEqual(ModelTwo.objects.count(), 2)
+
+
+class PipelineArgumentsTest(TestCase):
+    def test_atomic_block(self):
+        with self.assertRaises(InvalidArguments):
+            create(ModelOne, 2, pipeline=True)
+
+    def test_schedule(self):
+        with self.assertRaises(InvalidArguments):
+            create(ModelTwo, 3, schedule=True, pipeline=True)
+        self.assertEqual(ModelTwo.objects.count(), 0)
+
+    def test_forms(self):
+        with self.assertRaises(InvalidArguments):
+            create_form(FormOne, pipeline=True)
+
+
+class PipelineContentionTest(TransactionTestCase):
+    def test_in_memory_sqlite(self):
+        # Parents are saved by the producer while batches are inserted.
+        models = create(ModelTwo, 2000, pipeline=True, batch_size=10)
+        self.assertEqual(len(models), 2000)
+        self.assertEqual(ModelTwo.objects.count(), 2000)
@@ -0,0 +1,82 @@
+import time
+
+from django.test import TestCase
+
+from fixtureless import pool
+from fixtureless.generator import Generator, create_model_instance
+from test_app.models import ModelOne
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class ValuePoolTest(TestCase):
+    def tearDown(self):
+        pool.disable()
+
+    def test_get_registers_and_falls_back(self):
+        value_pool = pool.ValuePool(size=4)
+        val = value_pool.get(Generator._random_chars, 10, 'ab')
+        self.assertTrue(1 <= len(val) <= 10)
+        self.assertEqual(len(value_pool._buffers), 1)
+
+        # Nothing has been filled yet, so values are built inline.
+        val = value_pool.get(Generator._random_chars, 10, 'ab')
+        self.assertTrue(1 <= len(val) <= 10)
+
+    def test_fill_is_bounded(self):
+        value_pool = pool.ValuePool(size=4)
+        value_pool.get(Generator._random_json)
+        value_pool.get(Generator._random_slug, 20)
+        self.assertEqual(value_pool.fill(), 8)
+        self.assertEqual(value_pool.fill(), 0)
+        for buf in value_pool._buffers.values():
+            self.assertEqual(len(buf), 4)
+
+    def test_get_pops_from_buffer(self):
+        value_pool = pool.ValuePool(size=4)
+        value_pool.get(Generator._random_decimal, 10, 2)
+        value_pool.fill()
+        buf = value_pool._buffers[(Generator._random_decimal, 10, 2)]
+        first = buf[0]
+        self.assertEqual(
+            value_pool.get(Generator._random_decimal, 10, 2), first)
+        self.assertEqual(len(buf), 3)
+
+    def test_start_and_stop(self):
+        value_pool = pool.enable(size=8)
+        self.assertIs(pool.get_pool(), value_pool)
+        self.assertTrue(value_pool.running)
+        pool.draw(Generator._random_json)
+        buf = value_pool._buffers[(Generator._random_json,)]
+        self.assertTrue(_wait_for(lambda: len(buf) == 8))
+
+        pool.disable()
+        self.assertFalse(value_pool.running)
+        self.assertIsNone(pool.get_pool())
+
+    def test_enabled_context(self):
+        with pool.enabled(size=8) as value_pool:
+            self.assertTrue(value_pool.running)
+        self.assertFalse(value_pool.running)
+        self.assertIsNone(pool.get_pool())
+
+    def test_generator_consumes_from_pool(self):
+        value_pool = pool.enable(size=8)
+        create_model_instance(ModelOne)
+        field = ModelOne._meta.get_field('decimal_field')
+        key = (Generator._random_decimal, field.max_digits,
+               field.decimal_places)
+        self.assertIn(key, value_pool._buffers)
+        buf = value_pool._buffers[key]
+        self.assertTrue(_wait_for(lambda: len(buf) == 8))
+
+        value_pool.stop()
+        first = buf[0]
+        model_one = create_model_instance(ModelOne)
+        self.assertEqual(model_one.decimal_field, first)
+        self.assertEqual(len(buf), 7)
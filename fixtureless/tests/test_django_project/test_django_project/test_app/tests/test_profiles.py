@@ -0,0 +1,83 @@
+import collections
+import os
+import shutil
+import tempfile
+from decimal import Decimal
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from fixtureless.factory import build, create
+from fixtureless.profiles import Profile
+from test_app.models import ModelOne, ModelTwo
+
+STATS = {
+    'test_app_modelone': {
+        'char_field': {'null_frac': 0, 'n_distinct': 3, 'avg_width': 11,
+                       'most_common_vals': ['gold'],
+                       'most_common_freqs': [0.5]},
+        'decimal_field': {'null_frac': 0, 'n_distinct': -0.1,
+                          'avg_width': 8, 'most_common_vals': None,
+                          'most_common_freqs': None},
+        'text_field': {'null_frac': 0, 'n_distinct': -1, 'avg_width': 201},
+        'integer_field': {'null_frac': 0, 'n_distinct': 2,
+                          'most_common_vals': ['1', '2'],
+                          'most_common_freqs': [0.6, 0.2]},
+        'auto_field': {'null_frac': 0, 'n_distinct': -1},
+    },
+}
+
+
+class ProfileTest(TestCase):
+    def setUp(self):
+        self.profile = Profile(STATS)
+
+    def test_strategies(self):
+        strategies = self.profile.strategies(ModelOne)
+        self.assertEqual(
+            set(strategies),
+            set(['char_field', 'decimal_field', 'text_field',
+                 'integer_field']))
+        self.assertEqual(self.profile.strategies(ModelTwo), {})
+
+    def test_most_common_vals(self):
+        models = build(ModelOne, 200, strategies=self.profile.strategies(
+            ModelOne, rows=200))
+        chars = collections.Counter(obj.char_field for obj in models)
+        self.assertEqual(len(chars), 3)
+        self.assertGreater(chars['gold'], 60)
+        self.assertEqual(
+            set(obj.integer_field for obj in models), set([1, 2]))
+
+    def test_n_distinct(self):
+        models = build(ModelOne, 200, strategies=self.profile.strategies(
+            ModelOne, rows=200))
+        decimals = set(obj.decimal_field for obj in models)
+        self.assertEqual(len(decimals), 20)
+        self.assertIsInstance(decimals.pop(), Decimal)
+        self.assertEqual(len(set(obj.text_field for obj in models)), 200)
+
+    def test_avg_width(self):
+        models = build(ModelOne, 100, strategies=self.profile.strategies(
+            ModelOne))
+        widths = [len(obj.text_field) for obj in models]
+        self.assertTrue(all(100 <= width <= 300 for width in widths))
+
+    def test_dump_and_load(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'profile.json')
+            self.profile.dump(path)
+            self.assertEqual(Profile.load(path).tables, STATS)
+        finally:
+            shutil.rmtree(directory)
+
+    @skipUnless(connection.vendor == 'postgresql', 'Reads pg_stats')
+    def test_from_pg_stats(self):
+        create(ModelOne, 10, strategies={'char_field': lambda **kwargs: 'a'})
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE test_app_modelone')
+        profile = Profile.from_pg_stats([ModelOne])
+        stats = profile.tables['test_app_modelone']['char_field']
+        self.assertEqual(stats['most_common_vals'], ['a'])
@@ -0,0 +1,54 @@
+from django.test import TestCase
+
+from fixtureless import exceptions
+from fixtureless.factory import build, create
+from fixtureless.prototype import copy
+from test_app.models import ModelFive, ModelOne, ModelTwo
+
+
+class PrototypeTest(TestCase):
+    def test_copies(self):
+        models = create(ModelOne, 3, prototype=True)
+        self.assertEqual(ModelOne.objects.count(), 3)
+        self.assertEqual(len(set(model.pk for model in models)), 3)
+        first, second, _ = models
+        self.assertEqual(first.char_field, second.char_field)
+        self.assertEqual(first.decimal_field, second.decimal_field)
+        self.assertIsNot(first._state, second._state)
+
+    def test_vary(self):
+        models = build(ModelOne, 20, prototype=True, vary=['char_field'])
+        self.assertGreater(len(set(model.char_field for model in models)), 1)
+        self.assertEqual(len(set(model.text_field for model in models)), 1)
+
+    def test_initial(self):
+        initial = {'char_field': 'pinned'}
+        models = build(ModelFive, [initial, initial, None], prototype=True)
+        self.assertEqual([model.char_field for model in models[:2]],
+                         ['pinned', 'pinned'])
+        self.assertNotEqual(models[2].char_field, 'pinned')
+
+    def test_unique_relations(self):
+        models = create(ModelTwo, 3, prototype=True)
+        self.assertEqual(len(set(model.one_to_one_id for model in models)), 3)
+        self.assertEqual(len(set(model.foreign_key_id for model in models)),
+                         1)
+        for model in models:
+            self.assertEqual(model.one_to_one.pk, model.one_to_one_id)
+
+    def test_copy(self):
+        model_two = build(ModelTwo)
+        clone = copy(model_two)
+        self.assertIsNot(clone.__dict__, model_two.__dict__)
+        self.assertIs(clone.foreign_key, model_two.foreign_key)
+        self.assertTrue(clone._state.adding)
+
+    def test_invalid(self):
+        with self.assertRaises(exceptions.InvalidArguments):
+            build(ModelOne, 2, prototype=True, vary=['missing'])
+        with self.assertRaises(exceptions.InvalidArguments):
+            build(ModelOne, 2, vary=['char_field'])
+        with self.assertRaises(exceptions.InvalidArguments):
+            build(ModelOne, 2, prototype=True, lazy=True)
+        with self.assertRaises(exceptions.InvalidArguments):
+            create(ModelOne, 2, prototype=True, schedule=True)
@@ -0,0 +1,76 @@
+from django.test import TestCase
+from django.test.runner import DiscoverRunner
+
+from fixtureless.factory import create
+from fixtureless.runner import SeededTestRunner
+from test_app.models import ModelFive
+
+events = []
+
+
+def seed():
+    events.append('seed')
+    create(ModelFive, 2, schedule=True)
+
+
+class _Creation(object):
+    def __init__(self, alias):
+        self.alias = alias
+
+    def clone_test_db(self, suffix, verbosity=1, keepdb=False):
+        events.append(('clone', self.alias, suffix))
+
+    def serialize_db_to_string(self):
+        events.append(('serialize', self.alias))
+        return 'serialized'
+
+
+class _Connection(object):
+    def __init__(self, alias, test_settings=None):
+        self.settings_dict = {'TEST': test_settings or {}}
+        self.creation = _Creation(alias)
+
+
+class _CreatedRunner(DiscoverRunner):
+    def setup_databases(self, **kwargs):
+        events.append(('create', self.parallel))
+        return [(_Connection('default'), 'default', True),
+                (_Connection('mirror'), 'default', False),
+                (_Connection('other', {'SERIALIZE': False}), 'other', True)]
+
+
+class _Runner(SeededTestRunner, _CreatedRunner):
+    pass
+
+
+class SeededTestRunnerTest(TestCase):
+    def setUp(self):
+        del events[:]
+
+    def test_setup_databases(self):
+        runner = _Runner(parallel=2)
+        runner.seed = seed
+        old_config = runner.setup_databases()
+        self.assertEqual(len(old_config), 3)
+        self.assertEqual(runner.parallel, 2)
+        self.assertEqual(events, [
+            ('create', 1), 'seed', ('serialize', 'default'),
+            ('clone', 'default', '1'), ('clone', 'default', '2'),
+            ('clone', 'other', '1'), ('clone', 'other', '2')])
+        self.assertEqual(old_config[0][0]._test_serialized_contents,
+                         'serialized')
+        self.assertEqual(ModelFive.objects.count(), 2)
+
+    def test_serial(self):
+        runner = _Runner()
+        runner.setup_databases()
+        self.assertEqual(events, [('create', 1)])
+
+    def test_get_seed(self):
+        runner = SeededTestRunner()
+        self.assertIsNone(runner.get_seed())
+        with self.settings(FIXTURELESS_TEST_SEED='test_app.tests.'
+                                                 'test_runner.seed'):
+            self.assertIs(runner.get_seed(), seed)
+        runner.seed = seed
+        self.assertIs(runner.get_seed(), seed)
@@ -0,0 +1,57 @@
+from django.test import TestCase
+
+from fixtureless.exceptions import InvalidArguments
+from fixtureless.factory import build, create
+from fixtureless.scheduler import dependencies, order
+from test_app.models import ModelOne, ModelTwo
+
+
+class OrderTest(TestCase):
+    def test_dependencies(self):
+        self.assertEqual(dependencies(ModelOne), set())
+        self.assertEqual(dependencies(ModelTwo), set([ModelOne]))
+
+    def test_order(self):
+        self.assertEqual(order([ModelTwo, ModelOne]), [ModelOne, ModelTwo])
+        self.assertEqual(order([ModelOne, ModelTwo]), [ModelOne, ModelTwo])
+        self.assertEqual(order([ModelTwo]), [ModelTwo])
+
+
+class SchedulerTest(TestCase):
+    def test_requested_order_is_kept(self):
+        models = create((ModelTwo, 2), (ModelOne, 1), (ModelTwo, 1),
+                        schedule=True)
+        self.assertEqual(len(models), 4)
+        self.assertEqual(
+            [type(model) for model in models],
+            [ModelTwo, ModelTwo, ModelOne, ModelTwo])
+
+        # Foreign keys point at the requested parent, one-to-ones get new
+        # ones.
+        for model_two in (models[0], models[1], models[3]):
+            self.assertEqual(model_two.foreign_key, models[2])
+            self.assertNotEqual(model_two.one_to_one, models[2])
+        self.assertEqual(ModelOne.objects.count(), 4)
+        self.assertEqual(ModelTwo.objects.count(), 3)
+
+    def test_parents_in_bulk(self):
+        # One pk check and one insert for each of: requested ModelOnes,
+        # one-to-one parents and ModelTwos.
+        with self.assertNumQueries(6):
+            create((ModelOne, 2), (ModelTwo, 2), schedule=True)
+
+    def test_existing_parent(self):
+        model_one = create(ModelOne)
+        model_two = create(ModelTwo, schedule=True)
+        self.assertEqual(model_two.foreign_key, model_one)
+
+    def test_initial(self):
+        model_one = create(ModelOne)
+        initial = {'one_to_one': model_one, 'char_field': 'test value'}
+        model_two = create(ModelTwo, initial, schedule=True)
+        self.assertEqual(model_two.one_to_one, model_one)
+        self.assertEqual(model_two.char_field, 'test value')
+
+    def test_build(self):
+        with self.assertRaises(InvalidArguments):
+            build(ModelOne, schedule=True)
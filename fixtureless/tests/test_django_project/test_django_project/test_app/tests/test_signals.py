@@ -0,0 +1,88 @@
+from django.db.models.signals import post_init, post_save, pre_save
+from django.test import TestCase, TransactionTestCase
+
+from fixtureless.factory import build, create
+from fixtureless.signals import post_create
+from test_app.models import ModelOne, ModelTwo
+
+
+class Receiver(object):
+    def __init__(self, signal):
+        self.signal = signal
+        self.calls = []
+        signal.connect(self)
+
+    def __call__(self, sender, **kwargs):
+        self.calls.append((sender, kwargs))
+
+    def disconnect(self):
+        self.signal.disconnect(self)
+
+
+class SignalsTest(TestCase):
+    def setUp(self):
+        self.receivers = [Receiver(signal) for signal in
+                          (pre_save, post_save, post_init, post_create)]
+        self.pre_save, self.post_save, self.post_init, self.post_create = \
+            self.receivers
+
+    def tearDown(self):
+        for receiver in self.receivers:
+            receiver.disconnect()
+
+    def test_default(self):
+        create(ModelOne, 2)
+        self.assertEqual(len(self.post_save.calls), 2)
+        self.assertEqual(self.post_create.calls, [])
+
+    def test_muted(self):
+        create(ModelTwo, 2, signals=False)
+        build(ModelOne, signals=False)
+        for receiver in self.receivers:
+            self.assertEqual(receiver.calls, [])
+        self.assertEqual(ModelTwo.objects.count(), 2)
+
+        # Only for the duration of the call.
+        ModelOne.objects.first().save()
+        self.assertEqual(len(self.post_save.calls), 1)
+        self.assertNotIn('send', post_save.__dict__)
+
+    def test_batched(self):
+        models = create(ModelOne, 5, signals='batched', batch_size=2)
+        self.assertEqual(self.post_save.calls, [])
+        batches = [kwargs['instances'] for sender, kwargs
+                   in self.post_create.calls]
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertEqual(sum(batches, []), list(models))
+        self.assertEqual(self.post_create.calls[0][0], ModelOne)
+        self.assertEqual(self.post_create.calls[0][1]['using'], 'default')
+
+    def test_batched_parents(self):
+        create(ModelTwo, 2, signals='batched')
+        senders = [sender for sender, _ in self.post_create.calls]
+        self.assertEqual(senders, [ModelOne, ModelTwo])
+        self.assertEqual(
+            len(self.post_create.calls[0][1]['instances']), 3)
+
+    def test_batched_schedule(self):
+        create((ModelOne, 2), (ModelTwo, 2), schedule=True,
+               signals='batched')
+        counts = dict((sender, len(kwargs['instances']))
+                      for sender, kwargs in self.post_create.calls)
+        self.assertEqual(counts, {ModelOne: 4, ModelTwo: 2})
+
+
+class PipelineSignalsTest(TransactionTestCase):
+    def test_batched_pipeline(self):
+        post_save_receiver = Receiver(post_save)
+        post_create_receiver = Receiver(post_create)
+        try:
+            create(ModelOne, 5, pipeline=True, batch_size=2,
+                   signals='batched')
+        finally:
+            post_save_receiver.disconnect()
+            post_create_receiver.disconnect()
+        self.assertEqual(post_save_receiver.calls, [])
+        self.assertEqual(
+            sum(len(kwargs['instances'])
+                for _, kwargs in post_create_receiver.calls), 5)
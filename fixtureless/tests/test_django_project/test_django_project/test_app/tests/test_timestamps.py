@@ -0,0 +1,76 @@
+import datetime
+
+from django.db import models
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from fixtureless import timestamps
+from fixtureless.exceptions import InvalidArguments
+from fixtureless.factory import build, create
+from test_app.models import ModelOne
+
+START = datetime.datetime(2020, 1, 1)
+END = datetime.datetime(2020, 3, 1)
+
+
+class TimestampsTest(TestCase):
+    def test_window(self):
+        window = timestamps.Window(START, END)
+        models_one = build(ModelOne, 50, strategies={'datetime_field': window})
+        for model_one in models_one:
+            self.assertTrue(START <= model_one.datetime_field <= END)
+        self.assertGreater(
+            len(set(obj.datetime_field.date() for obj in models_one)), 1)
+
+    def test_monotonic(self):
+        monotonic = timestamps.Monotonic(START, rate=2)
+        models_one = create(
+            ModelOne, 5, strategies={'datetime_field': monotonic})
+        self.assertEqual(
+            [obj.datetime_field for obj in models_one],
+            [START + datetime.timedelta(seconds=i / 2.0) for i in range(5)])
+
+    def test_monotonic_jitter(self):
+        monotonic = timestamps.Monotonic(START, rate=10, jitter=True)
+        vals = [monotonic.sample() for _ in range(20)]
+        self.assertEqual(vals, sorted(vals))
+
+    def test_diurnal(self):
+        weights = [0] * 24
+        weights[13] = 1
+        diurnal = timestamps.Diurnal(START, END, weights)
+        for _ in range(20):
+            val = diurnal.sample()
+            self.assertEqual(val.hour, 13)
+            self.assertTrue(START <= val < END)
+
+    def test_field_types(self):
+        window = timestamps.Window(START, END)
+        model_one = build(ModelOne, strategies={models.DateField: window,
+                                                models.TimeField: window})
+        self.assertIsInstance(model_one.datetime_field, datetime.datetime)
+        self.assertEqual(type(model_one.date_field), datetime.date)
+        self.assertIsInstance(model_one.time_field, datetime.time)
+        self.assertTrue(START.date() <= model_one.date_field <= END.date())
+
+    @override_settings(USE_TZ=True)
+    def test_aware(self):
+        window = timestamps.Window(START, END)
+        model_one = build(ModelOne, strategies={'datetime_field': window})
+        self.assertTrue(timezone.is_aware(model_one.datetime_field))
+
+    def test_invalid(self):
+        with self.assertRaises(InvalidArguments):
+            timestamps.Window(END, START)
+        with self.assertRaises(InvalidArguments):
+            timestamps.Monotonic(START, rate=0)
+        with self.assertRaises(InvalidArguments):
+            timestamps.Diurnal(START, END, [1] * 12)
+        # Only the night hours, which have no weight
+        night = [0] * 6 + [1] * 18
+        with self.assertRaises(InvalidArguments):
+            timestamps.Diurnal(START, START + datetime.timedelta(hours=5),
+                               night)
+        diurnal = timestamps.Diurnal(
+            START, START + datetime.timedelta(hours=7), night)
+        self.assertEqual(diurnal.sample().hour, 6)
@@ -0,0 +1,72 @@
+from django.test import TestCase
+
+from fixtureless import exceptions
+from fixtureless.factory import create
+from fixtureless.trees import create_tree, parent_field
+from test_app.models import ModelOne, ModelSix, ModelSeven, ModelEleven
+
+
+class SelfReferenceTest(TestCase):
+    def test_create(self):
+        first, second = create(ModelSix, 2)
+        self.assertIsNone(first.parent)
+        self.assertEqual(second.parent, first)
+        self.assertEqual(first.sibling_id, first.pk)
+
+        model_seven = create(ModelSeven)
+        self.assertEqual(model_seven.parent_id, model_seven.pk)
+
+    def test_nullable_unique(self):
+        models = create(ModelEleven, 2)
+        self.assertEqual([model.twin for model in models], [None, None])
+        models = create(ModelEleven, 2, schedule=True)
+        self.assertEqual([model.twin for model in models], [None, None])
+
+    def test_schedule(self):
+        models = create(ModelSix, 3, schedule=True)
+        self.assertEqual([model.sibling_id for model in models],
+                         [model.pk for model in models])
+        self.assertEqual(ModelSix.objects.count(), 3)
+
+        models = create(ModelSeven, 2, schedule=True)
+        self.assertEqual(models[0].parent_id, models[0].pk)
+
+
+class TreeTest(TestCase):
+    def test_create_tree(self):
+        with self.assertNumQueries(6):
+            levels = create_tree(ModelSix, depth=3, fan_out=3, roots=2,
+                                 parent='parent')
+        self.assertEqual([len(level) for level in levels], [2, 6, 18])
+        self.assertEqual(ModelSix.objects.count(), 26)
+        self.assertEqual(
+            ModelSix.objects.filter(parent__isnull=True).count(), 2)
+        for root in levels[0]:
+            self.assertEqual(root.children.count(), 3)
+        leaf = ModelSix.objects.get(pk=levels[2][0].pk)
+        self.assertIn(leaf.parent.parent, levels[0])
+        self.assertEqual(leaf.sibling_id, leaf.pk)
+
+    def test_non_nullable_parent(self):
+        levels = create_tree(ModelSeven, depth=3, fan_out=(0, 2))
+        root = levels[0][0]
+        self.assertEqual(root.parent_id, root.pk)
+        self.assertLessEqual(len(levels), 3)
+        for level, parents in zip(levels[1:], levels):
+            for child in level:
+                self.assertIn(child.parent, parents)
+
+    def test_initial(self):
+        levels = create_tree(ModelSix, 2, 2, parent='parent',
+                             initial={'char_field': 'node'})
+        self.assertEqual(
+            set(node.char_field for level in levels for node in level),
+            set(['node']))
+
+    def test_parent_field(self):
+        self.assertEqual(parent_field(ModelSeven).name, 'parent')
+        self.assertEqual(parent_field(ModelSix, 'parent').name, 'parent')
+        with self.assertRaises(exceptions.InvalidArguments):
+            parent_field(ModelSix)
+        with self.assertRaises(exceptions.InvalidArguments):
+            parent_field(ModelOne)
@@ -0,0 +1,48 @@
+import itertools
+
+from django.test import TestCase
+
+from fixtureless import exceptions
+from fixtureless import trickle
+from test_app.models import ModelFive, ModelTwo
+
+
+class TrickleTest(TestCase):
+    def test_schedule(self):
+        self.assertEqual(list(itertools.islice(trickle.schedule(4), 3)),
+                         [0, 0.25, 0.5])
+        due = list(itertools.islice(trickle.schedule(10, 0.2, 2), 6))
+        self.assertEqual(due, [0, 0.1, 0.2, 0.2, 0.2, 0.3])
+
+    def test_rows(self):
+        report = trickle.create(ModelTwo, rate=200, rows=10)
+        self.assertEqual(ModelTwo.objects.count(), 10)
+        self.assertEqual(report.count, 10)
+        self.assertGreaterEqual(report.span, 9 / 200.0)
+        self.assertLessEqual(report.achieved_rate, 200 * 1.01)
+        self.assertEqual(sum(count for _, count in report.histogram()), 10)
+        self.assertIsNone(report.histogram()[-1][0])
+
+    def test_duration(self):
+        report = trickle.create(ModelFive, rate=100, duration=0.05,
+                                initial={'char_field': 'trickle'})
+        self.assertEqual(report.count, 5)
+        self.assertEqual(
+            ModelFive.objects.filter(char_field='trickle').count(), 5)
+
+    def test_bursts(self):
+        report = trickle.create(ModelFive, rate=10, duration=0.25,
+                                burst_every=0.1, burst_rows=3)
+        self.assertEqual(report.count, 3 + 2 * 3)
+
+    def test_iter_create(self):
+        stream = trickle.iter_create(ModelFive, rate=500, rows=3)
+        for instance in stream:
+            self.assertIsNotNone(instance.pk)
+        self.assertEqual(stream.report.count, 3)
+
+    def test_invalid(self):
+        with self.assertRaises(exceptions.InvalidArguments):
+            trickle.create(ModelFive, rate=0, rows=1)
+        with self.assertRaises(exceptions.InvalidArguments):
+            trickle.create(ModelFive, rate=10)
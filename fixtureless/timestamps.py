@@ -0,0 +1,138 @@
+"""
+Timestamps spread over time.
+
+The date, time and datetime generators return the current time, so a large
+seed lands in a single day (and partition).  These strategies spread the
+values instead.  Use them per field, or per call by keying them by field
+class (``DateField`` also covers its subclasses, ``DateTimeField``
+included):
+
+    from datetime import datetime, timedelta
+    from django.db import models
+    from fixtureless import timestamps
+
+    end = datetime(2024, 1, 1)
+    create(Event, 100000, strategies={
+        'created': timestamps.Monotonic(end - timedelta(days=30), rate=0.05),
+        models.DateField: timestamps.Window(end - timedelta(days=365), end)})
+
+Values are converted to the field: dates for ``DateField``, times for
+``TimeField`` and, for ``DateTimeField``, aware or naive datetimes
+following ``USE_TZ``.  Fields with ``auto_now`` or ``auto_now_add`` are
+overwritten by Django when saved.
+"""
+import bisect
+import datetime
+import random
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+from fixtureless import constants
+from fixtureless import exceptions
+
+
+def _to_field(val, field):
+    if isinstance(field, models.DateTimeField):
+        if getattr(settings, 'USE_TZ', False):
+            if timezone.is_naive(val):
+                val = timezone.make_aware(val, timezone.utc)
+        elif timezone.is_aware(val):
+            val = timezone.make_naive(val, timezone.utc)
+        return val
+    if isinstance(field, models.DateField):
+        return val.date()
+    if isinstance(field, models.TimeField):
+        return val.time()
+    return val
+
+
+class Timestamp(object):
+    """
+    Base class of the strategies.  Subclasses implement ``sample``, which
+    returns a datetime.
+    """
+    def __call__(self, **kwargs):
+        return _to_field(self.sample(), kwargs['field'])
+
+    def sample(self):
+        raise NotImplementedError
+
+
+class Window(Timestamp):
+    """
+    Uniformly distributed between ``start`` and ``end``.
+    """
+    def __init__(self, start, end):
+        if end <= start:
+            raise exceptions.InvalidArguments(
+                'The window ends before it starts')
+        self.start = start
+        self.seconds = (end - start).total_seconds()
+
+    def sample(self):
+        offset = random.uniform(0, self.seconds)
+        return self.start + datetime.timedelta(seconds=offset)
+
+
+class Monotonic(Timestamp):
+    """
+    Increasing from ``start`` at ``rate`` values per second.  With
+    ``jitter`` the gaps are exponentially distributed (Poisson arrivals)
+    instead of even.
+    """
+    def __init__(self, start=None, rate=1.0, jitter=False):
+        if rate <= 0:
+            raise exceptions.InvalidArguments('The rate must be positive')
+        self.current = start if start is not None else timezone.now()
+        self.rate = rate
+        self.jitter = jitter
+
+    def sample(self):
+        val = self.current
+        gap = random.expovariate(self.rate) if self.jitter else 1.0 / self.rate
+        self.current += datetime.timedelta(seconds=gap)
+        return val
+
+
+class Diurnal(Timestamp):
+    """
+    Spread over the days between ``start`` and ``end``, with the hour of the
+    day following ``weights`` (24 relative weights, see
+    constants.DIURNAL_WEIGHTS).
+    """
+    def __init__(self, start, end, weights=constants.DIURNAL_WEIGHTS):
+        if end <= start:
+            raise exceptions.InvalidArguments(
+                'The window ends before it starts')
+        if len(weights) != 24:
+            raise exceptions.InvalidArguments('Expected 24 hourly weights')
+        hours = set()
+        slot = start.replace(minute=0, second=0, microsecond=0)
+        while slot < end and len(hours) < 24:
+            hours.add(slot.hour)
+            slot += datetime.timedelta(hours=1)
+        if sum(weights[hour] for hour in hours) <= 0:
+            raise exceptions.InvalidArguments(
+                'The hours in the window all have a weight of 0')
+        self.start = start
+        self.end = end
+        self.days = (end - start).days + 1
+        self.cumulative = []
+        total = 0
+        for weight in weights:
+            total += weight
+            self.cumulative.append(total)
+
+    def sample(self):
+        midnight = self.start.replace(
+            hour=0, minute=0, second=0, microsecond=0)
+        while True:
+            hour = bisect.bisect_right(
+                self.cumulative, random.random() * self.cumulative[-1])
+            val = midnight + datetime.timedelta(
+                days=random.randrange(self.days), hours=hour,
+                seconds=random.uniform(0, 3600))
+            if self.start <= val < self.end:
+                return val
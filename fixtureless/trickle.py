@@ -0,0 +1,152 @@
+"""
+Rate-controlled inserts.
+
+Seeding inserts rows as fast as possible; soak tests of triggers,
+replication or vacuum need steady write traffic instead.  ``create``
+inserts generated rows one at a time at ``rate`` rows per second, for
+``duration`` seconds and/or up to ``rows`` rows, and reports the achieved
+rate and the latency of the inserts (see fixtureless.loadtest.TargetStats):
+
+    from fixtureless import trickle
+
+    report = trickle.create(Order, rate=50, duration=600,
+                            burst_every=60, burst_rows=500)
+    print(report.achieved_rate, report.percentile(99), report.histogram())
+
+``burst_every``/``burst_rows`` add ``burst_rows`` rows, due all at once,
+every ``burst_every`` seconds.  ``iter_create`` takes the same arguments
+and returns a ``Trickle``, which yields each instance once it is saved and
+keeps its report in ``report``:
+
+    for order in trickle.iter_create(Order, rate=10, rows=1000):
+        check_replica(order)
+
+Each row is generated ahead of its due time; only the save counts as the
+insert latency.  A row that is late is inserted straight away, and the
+largest delay is reported as ``lag``.
+"""
+import bisect
+import heapq
+import itertools
+import time
+from timeit import default_timer
+
+from django.db.models import Model
+
+from fixtureless import constants
+from fixtureless import exceptions
+from fixtureless.factory import Factory
+from fixtureless.loadtest import TargetStats
+
+
+def schedule(rate, burst_every=None, burst_rows=0):
+    """
+    Yield the times (in seconds from the start) rows are due at.
+    """
+    steady = (float(i) / rate for i in itertools.count())
+    if not (burst_every and burst_rows):
+        return steady
+    bursts = (k * burst_every for k in itertools.count(1)
+              for _ in range(burst_rows))
+    return heapq.merge(steady, bursts)
+
+
+class TrickleReport(TargetStats):
+    def __init__(self, name, rate):
+        super(TrickleReport, self).__init__(name, 0.0)
+        self.rate = rate
+        self.lag = 0.0
+        # Seconds between the first and the last insert
+        self.span = 0.0
+
+    @property
+    def achieved_rate(self):
+        """
+        Rows per second between the first and the last insert.
+        """
+        return (self.count - 1) / self.span if self.span else 0.0
+
+    def histogram(self, buckets=constants.TRICKLE_BUCKETS):
+        """
+        The number of inserts per latency bucket, as ``(upper bound, count)``
+        pairs; the last bound is None.
+        """
+        counts = [0] * (len(buckets) + 1)
+        for latency in self.latencies:
+            counts[bisect.bisect_left(buckets, latency)] += 1
+        return list(zip(list(buckets) + [None], counts))
+
+
+class Trickle(object):
+    def __init__(self, model, rate, duration=None, rows=None, initial=None,
+                 burst_every=None, burst_rows=0, strategies=None):
+        if not rate or rate <= 0:
+            raise exceptions.InvalidArguments('The rate must be positive.')
+        if duration is None and rows is None:
+            raise exceptions.InvalidArguments(
+                'A trickle needs a duration or a number of rows.')
+        self.model = model
+        self.rate = rate
+        self.duration = duration
+        self.rows = rows
+        self.initial = initial or {}
+        self.burst_every = burst_every
+        self.burst_rows = burst_rows
+        self.factory = Factory(Model, strategies=strategies)
+        self.report = TrickleReport(model.__name__, rate)
+
+    def _due(self):
+        due = schedule(self.rate, self.burst_every, self.burst_rows)
+        if self.duration is not None:
+            due = itertools.takewhile(lambda at: at < self.duration, due)
+        if self.rows is not None:
+            due = itertools.islice(due, self.rows)
+        return due
+
+    def __iter__(self):
+        report = self.report
+        start = first = None
+        for at in self._due():
+            instance = self.factory._create_instance(
+                self.model, **self.initial)
+            if start is None:
+                # The clock starts once the first row is ready.
+                start = default_timer() - at
+            delay = start + at - default_timer()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                report.lag = max(report.lag, -delay)
+            sent = default_timer()
+            if first is None:
+                first = sent
+            for _ in self.factory.save_instances([instance]):
+                pass
+            report.latencies.append(default_timer() - sent)
+            report.span = sent - first
+            report.elapsed = default_timer() - start
+            yield instance
+
+    def run(self):
+        for _ in self:
+            pass
+        return self.report
+
+
+def iter_create(model, rate, **kwargs):
+    """
+    Insert generated ``model`` instances at ``rate`` rows per second.
+    :param kwargs: ``duration``, ``rows``, ``initial``, ``burst_every``,
+        ``burst_rows`` and ``strategies``, see Trickle.
+    :return: A Trickle yielding the saved instances
+    """
+    return Trickle(model, rate, **kwargs)
+
+
+def create(model, rate, **kwargs):
+    """
+    Insert generated ``model`` instances at ``rate`` rows per second.
+    :param kwargs: See iter_create.
+    :return: The TrickleReport
+    """
+    return Trickle(model, rate, **kwargs).run()
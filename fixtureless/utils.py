@@ -1,4 +1,5 @@
 import functools
+import itertools
 import random
 import warnings
 
@@ -16,6 +17,27 @@ def list_get(array, index, default=None):
         return default
 
 
+def chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def sample_count(spec):
+    """
+    Draw a count from ``spec``: an int, an inclusive ``(low, high)`` range or
+    a callable returning an int.
+    """
+    if callable(spec):
+        return int(spec())
+    if isinstance(spec, (list, tuple)):
+        return random.randint(*spec)
+    return spec
+
+
 def get_random_dict():
     random_dict = {}
     more_keys = True